@@ -3,19 +3,25 @@ from __future__ import annotations
 import json
 import sqlite3
 import base64
+import io
 import re
 from datetime import datetime
 from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
+from functools import lru_cache
 from html import escape
 import time
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Any, Callable, Dict, List, Optional, TypeVar
 from urllib.parse import quote_plus, urlparse
 
+import numpy as np
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
+import pyarrow as pa
+import pyarrow.csv as pacsv
 import streamlit as st
 
 from truevibe import auth, database, ingestion, scoring, scraping
@@ -27,6 +33,7 @@ NAV_SECTIONS: Dict[str, str] = {
     "Score Influencers": "Import & Evaluate",
     "Insights & Reports": "Insights",
 }
+_NAV_OPTIONS = tuple(NAV_SECTIONS.keys())
 PLATFORM_PROFILE_URLS: Dict[str, str] = {
     "instagram": "https://www.instagram.com/{handle}",
     "tiktok": "https://www.tiktok.com/@{handle}",
@@ -34,6 +41,26 @@ PLATFORM_PROFILE_URLS: Dict[str, str] = {
     "facebook": "https://www.facebook.com/{handle}",
     "x": "https://x.com/{handle}",
 }
+RADAR_CATEGORIES = (
+    ("Reach", "reach_score"),
+    ("Interest", "interest_score"),
+    ("Engagement", "engagement_score"),
+    ("Content", "content_score"),
+    ("Authority", "authority_score"),
+    ("Values", "values_score"),
+)
+RADAR_LABELS = tuple(label for label, _ in RADAR_CATEGORIES)
+SCORE_COLS = [
+    "reach_score",
+    "interest_score",
+    "engagement_score",
+    "content_score",
+    "authority_score",
+    "values_score",
+    "total_score",
+]
+DASHBOARD_COLS = ["name", "platform", "follower_count", *SCORE_COLS, "updated_at"]
+DASHBOARD_DTYPES: Dict[str, str] = {"follower_count": "Int64", **{column: "float32" for column in SCORE_COLS}}
 VERO_COLORWAY = ["#0A6CC2", "#4BB7E5", "#0A223A", "#F6C343", "#F48668"]
 LINK_ICON_MAP: Dict[str, Dict[str, str]] = {
     "instagram": {"icon": "", "label": "Instagram", "color": "#E4405F"},
@@ -45,14 +72,60 @@ LINK_ICON_MAP: Dict[str, Dict[str, str]] = {
     "twitter": {"icon": "", "label": "X / Twitter", "color": "#111827"},
     "creatoriq": {"icon": "", "label": "CreatorIQ", "color": "#0A6CC2"},
 }
+STATIC_IMG_DIR = Path("static/img")
+STATIC_IMG_URL = "app/static/img"
 ICON_FILES: Dict[str, Path] = {
-    "instagram": Path("app/img/icon-instagram.png"),
-    "tiktok": Path("app/img/icon-tiktok.webp"),
-    "facebook": Path("app/img/icon-facebook.png"),
-    "youtube": Path("app/img/icon-youtube.png"),
-    "x": Path("app/img/icon-x.png"),
+    "instagram": STATIC_IMG_DIR / "icon-instagram.png",
+    "tiktok": STATIC_IMG_DIR / "icon-tiktok.webp",
+    "facebook": STATIC_IMG_DIR / "icon-facebook.png",
+    "youtube": STATIC_IMG_DIR / "icon-youtube.png",
+    "x": STATIC_IMG_DIR / "icon-x.png",
 }
-ICON_CACHE: Dict[str, tuple[str, str]] = {}
+CAMPAIGN_SUMMARY_TEMPLATE = """
+<div class="tv-campaign-summary">
+    <div class="tv-campaign-summary__header">
+        <p class="tv-campaign-eyebrow">Active campaign</p>
+        <h4>{e.name}</h4>
+        <div class="tv-campaign-tags">
+            <span class="tv-campaign-tag">{e.client}</span>
+            <span class="tv-campaign-tag">{e.market}</span>
+            <span class="tv-campaign-tag">Briefed {e.created}</span>
+        </div>
+    </div>
+    <div class="tv-campaign-objective">
+        <span>Objective focus</span>
+        <p>{e.objective}</p>
+    </div>
+    <div class="tv-campaign-stats">
+        <div class="tv-campaign-stat">
+            <label>Timeline</label>
+            <strong>{e.timeline}</strong>
+        </div>
+        <div class="tv-campaign-stat">
+            <label>KOLs tracked</label>
+            <strong>{e.kol_count}</strong>
+        </div>
+        <div class="tv-campaign-stat">
+            <label>Imports logged</label>
+            <strong>{e.source_count}</strong>
+        </div>
+        <div class="tv-campaign-stat">
+            <label>Brief added</label>
+            <strong>{e.created}</strong>
+        </div>
+    </div>
+    <div class="tv-campaign-meta-grid">
+        <div>
+            <span>Client</span>
+            <p>{e.client}</p>
+        </div>
+        <div>
+            <span>Market</span>
+            <p>{e.market}</p>
+        </div>
+    </div>
+</div>
+"""
 
 
 def _parse_compact_number(raw: str) -> Optional[float]:
@@ -153,6 +226,18 @@ def _content_balance_score_from_rate(rate: Optional[float]) -> Optional[float]:
     return None
 
 
+_DEFAULTS: Dict[str, str] = {
+    "client_name": "-",
+    "market": "-",
+    "platform": "Unknown",
+    "name": "Unknown",
+}
+
+
+def _field(row: Dict[str, Any], key: str) -> Any:
+    return row.get(key) or _DEFAULTS.get(key, "-")
+
+
 def _safe_float(value: Any, default: Optional[float] = 0.0) -> Optional[float]:
     try:
         if value is None:
@@ -840,17 +925,16 @@ def _link_badge(link: str) -> str:
                 badge = LINK_ICON_MAP.get(key, badge)
                 break
     color = badge["color"]
-    icon_data = _get_icon_data(platform_key)
+    icon_src = _get_icon_src(platform_key)
     label = badge["label"]
     short_path = parsed.path.strip("/")
     if short_path:
         if len(short_path) > 12:
             short_path = short_path[:12] + "…"
         display = f"{display}/{short_path}"
-    if icon_data:
-        mime, encoded = icon_data
+    if icon_src:
         icon_markup = (
-            f"<img src='data:{mime};base64,{encoded}' alt='{escape(label)}' "
+            f"<img src='{icon_src}' alt='{escape(label)}' "
             f"style='width:20px;height:20px;'/>"
         )
     else:
@@ -864,6 +948,22 @@ def _link_badge(link: str) -> str:
     )
 
 
+_MULTILINE_ESCAPES: Dict[str, str] = {
+    "&": "&amp;",
+    "<": "&lt;",
+    ">": "&gt;",
+    '"': "&quot;",
+    "'": "&#x27;",
+    "\n": "<br>",
+}
+_MULTILINE_ESCAPE_RE = re.compile(r"[&<>\"'\n]")
+
+
+def _escape_multiline(text: str) -> str:
+    """HTML-escape `text` and turn newlines into <br> in a single pass."""
+    return _MULTILINE_ESCAPE_RE.sub(lambda match: _MULTILINE_ESCAPES[match.group(0)], text)
+
+
 def _info_pill(label: str, value: str) -> str:
     return (
         "<div class='tv-info-pill'>"
@@ -873,27 +973,46 @@ def _info_pill(label: str, value: str) -> str:
     )
 
 
+ICON_MIME_TYPES: Dict[str, str] = {
+    ".svg": "image/svg+xml",
+    ".png": "image/png",
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".webp": "image/webp",
+}
+
+
+@lru_cache(maxsize=32)
+def _load_icon_data(norm_key: str) -> Optional[tuple[str, str]]:
+    path = ICON_FILES.get(norm_key)
+    if not path or not path.exists():
+        return None
+    mime = ICON_MIME_TYPES.get(path.suffix.lower(), "image/png")
+    return mime, base64.b64encode(path.read_bytes()).decode("utf-8")
+
+
 def _get_icon_data(key: Optional[str]) -> Optional[tuple[str, str]]:
     if not key:
         return None
-    norm_key = key.lower()
-    path = ICON_FILES.get(norm_key)
+    return _load_icon_data(key.lower())
+
+
+def _get_icon_src(key: Optional[str]) -> Optional[str]:
+    """
+    Prefer Streamlit's static file route so browsers cache icons across reruns; inline as base64 otherwise.
+    """
+    if not key:
+        return None
+    path = ICON_FILES.get(key.lower())
     if not path or not path.exists():
         return None
-    cached = ICON_CACHE.get(norm_key)
-    if cached:
-        return cached
-    suffix = path.suffix.lower()
-    mime_map = {
-        ".svg": "image/svg+xml",
-        ".png": "image/png",
-        ".jpg": "image/jpeg",
-        ".jpeg": "image/jpeg",
-        ".webp": "image/webp",
-    }
-    mime = mime_map.get(suffix, "image/png")
-    ICON_CACHE[norm_key] = (mime, base64.b64encode(path.read_bytes()).decode("utf-8"))
-    return ICON_CACHE[norm_key]
+    if st.get_option("server.enableStaticServing"):
+        return f"{STATIC_IMG_URL}/{path.name}"
+    icon_data = _get_icon_data(key)
+    if not icon_data:
+        return None
+    mime, encoded = icon_data
+    return f"data:{mime};base64,{encoded}"
 
 
 def run_with_timer(label: str, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
@@ -1005,12 +1124,11 @@ def handle_registration(full_name: str, email: str, password: str) -> None:
 
 
 def render_application() -> None:
-    options = list(NAV_SECTIONS.keys())
-    active_view = st.session_state.active_view if st.session_state.active_view in options else options[0]
+    active_view = st.session_state.active_view if st.session_state.active_view in NAV_SECTIONS else _NAV_OPTIONS[0]
     with tv_card("Navigation", "Jump between workspace modules.", badge="Menu"):
-        nav_cols = st.columns(len(options))
-        for option, col in zip(options, nav_cols):
-            with col:
+        nav_cols = st.columns(len(_NAV_OPTIONS))
+        for idx, option in enumerate(_NAV_OPTIONS):
+            with nav_cols[idx]:
                 is_active = option == active_view
                 if st.button(
                     option,
@@ -1108,6 +1226,8 @@ def render_campaigns_tab() -> None:
                             market=market,
                             objective=composed_objective,
                         )
+                        _campaigns_and_markets.clear()
+                        _campaign_label_map.clear()
                         st.success(f"Campaign {name} created !")
 
     campaigns = database.list_campaigns_for_user(st.session_state.user["id"])
@@ -1115,11 +1235,15 @@ def render_campaigns_tab() -> None:
         if not campaigns:
             st.info("No campaigns yet. Create one above.")
         else:
-            campaign_labels = [f"{c['name']} | {c.get('market') or 'N/A'}" for c in campaigns]
-            try:
-                active_index = [c["id"] for c in campaigns].index(st.session_state.active_campaign_id)
-            except ValueError:
-                active_index = 0
+            campaign_labels: List[str] = []
+            label_to_campaign: Dict[str, Dict[str, Any]] = {}
+            id_to_index: Dict[int, int] = {}
+            for idx, c in enumerate(campaigns):
+                label = f"{c['name']} | {c.get('market') or 'N/A'}"
+                campaign_labels.append(label)
+                label_to_campaign.setdefault(label, c)
+                id_to_index.setdefault(c["id"], idx)
+            active_index = id_to_index.get(st.session_state.active_campaign_id, 0)
             with tv_card("Your Campaigns", "Switch focus and keep the key brief top of mind.", badge="Pipeline"):
                 selection = st.selectbox(
                     "Active campaign",
@@ -1127,85 +1251,9 @@ def render_campaigns_tab() -> None:
                     index=active_index,
                     key="campaign_select",
                 )
-                active_campaign = campaigns[campaign_labels.index(selection)]
+                active_campaign = label_to_campaign[selection]
                 st.session_state.active_campaign_id = active_campaign["id"]
-                raw_objective = (active_campaign.get("objective") or "").strip()
-                timeline_text = "-"
-                if raw_objective:
-                    filtered_lines: List[str] = []
-                    for line in raw_objective.splitlines():
-                        stripped = line.strip()
-                        if not stripped:
-                            continue
-                        if stripped.lower().startswith("timeline:"):
-                            timeline_text = stripped.split(":", 1)[1].strip() or "-"
-                        else:
-                            filtered_lines.append(stripped)
-                    objective_text = "\n".join(filtered_lines).strip() or "-"
-                else:
-                    objective_text = "-"
-                timeline_text = timeline_text.replace("\x1a", " - ").replace("\u2023", " - ")
-                truncated_objective = objective_text if len(objective_text) <= 260 else f"{objective_text[:257].rstrip()}..."
-                objective_markup = escape(truncated_objective).replace("\n", "<br>")
-                created_at_display = "-"
-                created_at_raw = active_campaign.get("created_at")
-                if created_at_raw:
-                    try:
-                        created_at_display = datetime.fromisoformat(created_at_raw).strftime("%b %d, %Y")
-                    except ValueError:
-                        created_at_display = created_at_raw.split("T")[0]
-                kol_count = len(database.list_campaign_influencers(active_campaign["id"]))
-                source_count = len(database.list_kol_sources(active_campaign["id"]))
-                client_display = active_campaign.get("client_name") or "-"
-                market_display = active_campaign.get("market") or "-"
-                st.markdown(
-                    f"""
-                    <div class="tv-campaign-summary">
-                        <div class="tv-campaign-summary__header">
-                            <p class="tv-campaign-eyebrow">Active campaign</p>
-                            <h4>{escape(active_campaign['name'])}</h4>
-                            <div class="tv-campaign-tags">
-                                <span class="tv-campaign-tag">{escape(client_display)}</span>
-                                <span class="tv-campaign-tag">{escape(market_display)}</span>
-                                <span class="tv-campaign-tag">Briefed {escape(created_at_display)}</span>
-                            </div>
-                        </div>
-                        <div class="tv-campaign-objective">
-                            <span>Objective focus</span>
-                            <p>{objective_markup}</p>
-                        </div>
-                        <div class="tv-campaign-stats">
-                            <div class="tv-campaign-stat">
-                                <label>Timeline</label>
-                                <strong>{escape(timeline_text or "-")}</strong>
-                            </div>
-                            <div class="tv-campaign-stat">
-                                <label>KOLs tracked</label>
-                                <strong>{kol_count}</strong>
-                            </div>
-                            <div class="tv-campaign-stat">
-                                <label>Imports logged</label>
-                                <strong>{source_count}</strong>
-                            </div>
-                            <div class="tv-campaign-stat">
-                                <label>Brief added</label>
-                                <strong>{escape(created_at_display)}</strong>
-                            </div>
-                        </div>
-                        <div class="tv-campaign-meta-grid">
-                            <div>
-                                <span>Client</span>
-                                <p>{escape(client_display)}</p>
-                            </div>
-                            <div>
-                                <span>Market</span>
-                                <p>{escape(market_display)}</p>
-                            </div>
-                        </div>
-                    </div>
-                    """,
-                    unsafe_allow_html=True,
-                )
+                _render_campaign_summary(active_campaign)
     if not campaigns:
         return
     active_campaign = next(
@@ -1215,6 +1263,52 @@ def render_campaigns_tab() -> None:
     render_campaign_ingestion_controls(active_campaign)
 
 
+def _render_campaign_summary(active_campaign: Dict[str, Any]) -> None:
+    raw_objective = (active_campaign.get("objective") or "").strip()
+    timeline_text = "-"
+    if raw_objective:
+        filtered_lines: List[str] = []
+        for line in raw_objective.splitlines():
+            stripped = line.strip()
+            if not stripped:
+                continue
+            if stripped.lower().startswith("timeline:"):
+                timeline_text = stripped.split(":", 1)[1].strip() or "-"
+            else:
+                filtered_lines.append(stripped)
+        objective_text = "\n".join(filtered_lines).strip() or "-"
+    else:
+        objective_text = "-"
+    timeline_text = timeline_text.replace("\x1a", " - ").replace("\u2023", " - ")
+    truncated_objective = objective_text if len(objective_text) <= 260 else f"{objective_text[:257].rstrip()}..."
+    objective_markup = _escape_multiline(truncated_objective)
+    created_at_display = "-"
+    created_at_raw = active_campaign.get("created_at")
+    if created_at_raw:
+        try:
+            created_at_display = datetime.fromisoformat(created_at_raw).strftime("%b %d, %Y")
+        except ValueError:
+            created_at_display = created_at_raw.split("T")[0]
+    kol_count = database.count_campaign_influencers(active_campaign["id"])
+    source_count = database.count_kol_sources(active_campaign["id"])
+    client_display = _field(active_campaign, "client_name")
+    market_display = _field(active_campaign, "market")
+    summary = SimpleNamespace(
+        name=escape(active_campaign["name"]),
+        client=escape(client_display),
+        market=escape(market_display),
+        created=escape(created_at_display),
+        timeline=escape(timeline_text or "-"),
+        objective=objective_markup,
+        kol_count=kol_count,
+        source_count=source_count,
+    )
+    st.markdown(
+        CAMPAIGN_SUMMARY_TEMPLATE.format(e=summary),
+        unsafe_allow_html=True,
+    )
+
+
 def render_campaign_ingestion_controls(campaign: Dict[str, Any]) -> None:
     st.markdown(f"### Manage creators for {escape(campaign['name'])}")
     with tv_card("Add KOLs", "Drop a publish KOL list to ingest data.", badge="Ingest"):
@@ -1259,8 +1353,8 @@ def render_campaign_ingestion_controls(campaign: Dict[str, Any]) -> None:
                                 )
                             count = summary.get("count", 0)
                             st.success(f"Imported {count} creator(s) from the CreatorIQ report.")
-                            for warning in summary.get("warnings", []):
-                                st.warning(warning)
+                            if summary.get("warning"):
+                                st.warning(f"{summary['warning']} ({summary.get('skipped', 0)} creator(s) affected)")
                         else:
                             profile = run_with_timer(
                                 "Fetching profile",
@@ -1277,6 +1371,7 @@ def render_campaign_ingestion_controls(campaign: Dict[str, Any]) -> None:
                                 status="ingested",
                             )
                             st.success(f"Added {influencer['name']} ({influencer['platform']}).")
+                        _clear_dashboard_caches()
                         st.rerun()
                     except CreatorIQError as err:
                         st.error(f"CreatorIQ import failed: {err}")
@@ -1288,9 +1383,9 @@ def render_campaign_ingestion_controls(campaign: Dict[str, Any]) -> None:
         with tv_card("Recent KOL List", "Latest CreatorIQ imports and single profiles.", badge="History"):
             st.markdown("##### Latest KOL entries")
             source = sources[0]
-            platform = source.get("platform") or "Unknown"
-            link = source.get("publish_link") or "-"
-            status = source.get("status") or "-"
+            platform = _field(source, "platform")
+            link = _field(source, "publish_link")
+            status = _field(source, "status")
             if link and link != "-":
                 link_markup = f"<a href='{escape(link)}' target='_blank' style='color:#0A6CC2;font-weight:600;text-decoration:none;'>{escape(link)}</a>"
             else:
@@ -1309,37 +1404,37 @@ def render_campaign_ingestion_controls(campaign: Dict[str, Any]) -> None:
                 """,
                 unsafe_allow_html=True,
             )
-        raw_profile_rows: List[Dict[str, Any]] = []
-        for source in sources:
-            payload: Dict[str, Any] = {}
-            raw_payload = source.get("raw_payload")
-            if raw_payload:
-                try:
-                    payload = json.loads(raw_payload)
-                except json.JSONDecodeError:
-                    payload = {}
-            profiles = payload.get("profiles") if isinstance(payload, dict) else None
-            if isinstance(profiles, list):
-                for profile in profiles:
-                    details = profile.get("Details")
-                    row = {
-                        "Source": source.get("publish_link"),
-                        "Full Name": profile.get("Full Name"),
-                        "Handle": profile.get("Handle"),
-                        "Platform": profile.get("Platform"),
-                        "Followers": profile.get("Followers"),
-                        "Bio": profile.get("Bio"),
-                        "Image": profile.get("Image URL"),
-                    }
-                    row.update(_flatten_details(details))
-                    raw_profile_rows.append(row)
-        if raw_profile_rows:
-            with tv_card("Raw imported profiles", "Deep dive on the JSON pulled from CreatorIQ.", badge="Diagnostics"):
-                raw_df = pd.DataFrame(raw_profile_rows)
-                st.dataframe(raw_df, use_container_width=True, hide_index=True)
-        else:
-            st.info("Raw profile payloads not available for these sources.")
-
+        with tv_card("Raw imported profiles", "Deep dive on the JSON pulled from CreatorIQ.", badge="Diagnostics"):
+            if st.checkbox("Show raw profiles", key=f"show_raw_{campaign['id']}"):
+                raw_df = _build_raw_df(sources)
+                if raw_df is not None:
+                    st.dataframe(raw_df, use_container_width=True, hide_index=True)
+                else:
+                    st.info("Raw profile payloads not available for these sources.")
+
+
+def _build_raw_df(sources: List[Dict[str, Any]]) -> Optional[pd.DataFrame]:
+    raw_profile_rows: List[Dict[str, Any]] = []
+    for source in sources:
+        payload = database.decode_kol_payload(source.get("raw_payload"))
+        profiles = payload.get("profiles")
+        if isinstance(profiles, list):
+            for profile in profiles:
+                details = profile.get("Details")
+                row = {
+                    "Source": source.get("publish_link"),
+                    "Full Name": profile.get("Full Name"),
+                    "Handle": profile.get("Handle"),
+                    "Platform": profile.get("Platform"),
+                    "Followers": profile.get("Followers"),
+                    "Bio": profile.get("Bio"),
+                    "Image": profile.get("Image URL"),
+                }
+                row.update(_flatten_details(details))
+                raw_profile_rows.append(row)
+    if not raw_profile_rows:
+        return None
+    return pd.DataFrame(raw_profile_rows)
 
 
 def render_kol_workflow_tab() -> None:
@@ -1368,9 +1463,9 @@ def render_kol_workflow_tab() -> None:
                 st.dataframe(display_df, use_container_width=True, hide_index=True)
                 option_map: Dict[str, Dict[str, Any]] = {}
                 for row in pool_rows:
-                    name = row.get("name") or "Unknown"
-                    handle = row.get("handle") or "-"
-                    platform = row.get("platform") or "Unknown"
+                    name = _field(row, "name")
+                    handle = _field(row, "handle")
+                    platform = _field(row, "platform")
                     label = f"{name} (@{handle}) - {platform}"
                     option_map[label] = row
                 selection = st.selectbox(
@@ -1381,6 +1476,7 @@ def render_kol_workflow_tab() -> None:
                 if st.button("Add selected KOL", key=f"kol_pool_add_{campaign['id']}"):
                     chosen = option_map[selection]
                     database.ensure_campaign_influencer(campaign["id"], chosen["id"])
+                    _clear_dashboard_caches()
                     st.success(f"Added {chosen['name']} to {campaign['name']}.")
                     st.rerun()
 
@@ -1399,7 +1495,7 @@ def render_scoring_form(campaign: Dict[str, Any]) -> None:
         enriched = dict(row)
         enriched["status"] = status
         enriched_rows.append(enriched)
-    platforms = sorted({row["platform"] or "Unknown" for row in enriched_rows})
+    platforms = sorted({_field(row, "platform") for row in enriched_rows})
     filter_cols = st.columns(2)
     with filter_cols[0]:
         platform_choice = st.selectbox(
@@ -1417,7 +1513,7 @@ def render_scoring_form(campaign: Dict[str, Any]) -> None:
     filtered_rows = [
         row
         for row in enriched_rows
-        if (row["platform"] or "Unknown") in selected_platforms
+        if _field(row, "platform") in selected_platforms
         and (status_choice == "All statuses" or row["status"] == status_choice)
     ]
     if not filtered_rows:
@@ -1476,11 +1572,10 @@ def render_scoring_form(campaign: Dict[str, Any]) -> None:
                 st.markdown(f"<div class='tv-link-grid'>{badges}</div>", unsafe_allow_html=True)
         with profile_cols[1]:
             platform_key = (selected.get("platform") or "").lower()
-            icon_data = _get_icon_data(platform_key)
-            if icon_data:
-                mime, encoded = icon_data
+            icon_src = _get_icon_src(platform_key)
+            if icon_src:
                 icon_markup = (
-                    f"<img src='data:{mime};base64,{encoded}' alt='{escape(platform_key or 'platform')}' "
+                    f"<img src='{icon_src}' alt='{escape(platform_key or 'platform')}' "
                     f"style='width:26px;height:26px;'/>"
                 )
             else:
@@ -1532,6 +1627,11 @@ def render_scoring_form(campaign: Dict[str, Any]) -> None:
             if saved_balance_score is not None:
                 st.caption(f"Content balance: {saved_balance_score:.1f}")
 
+    _score_form_fragment(selected, quant_scores)
+
+
+@st.fragment
+def _score_form_fragment(selected: Dict[str, Any], quant_scores: Dict[str, float]) -> None:
     with tv_card("Manual scoring", "Provide your qualitative inputs.", badge="Score input"):
         suffix = selected.get("campaign_influencer_id")
         with st.form(f"score_form_{suffix}"):
@@ -1623,68 +1723,149 @@ def render_scoring_form(campaign: Dict[str, Any]) -> None:
                     values_overall=values_overall,
                     qualitative_notes=notes,
                 )
-                database.save_campaign_influencer_scores(selected["campaign_influencer_id"], payload)
-                st.success("Score saved!")
+                database.save_campaign_influencer_scores(selected["campaign_influencer_id"], payload.as_dict())
+                _clear_dashboard_caches()
+                st.toast("Score saved!")
+                st.rerun()
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _load_dashboard_df(campaign_id: int) -> pd.DataFrame:
+    rows = database.list_dashboard_rows(campaign_id)
+    return pd.DataFrame.from_records(rows, columns=DASHBOARD_COLS).astype(DASHBOARD_DTYPES)
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _dashboard_aggregates(campaign_id: int) -> SimpleNamespace:
+    df = _load_dashboard_df(campaign_id)
+    if df.empty:
+        return SimpleNamespace(df=df, scored=df, completed=0, avg=None, top=None, max_score=0.0)
+    totals = df["total_score"]
+    stats = totals.agg(["count", "mean", "max"])
+    completed = int(stats["count"])
+    if not completed:
+        return SimpleNamespace(df=df, scored=df.iloc[0:0], completed=0, avg=None, top=None, max_score=0.0)
+    return SimpleNamespace(
+        df=df,
+        scored=df[totals.notna()].sort_values("total_score", ascending=False),
+        completed=completed,
+        avg=float(stats["mean"]),
+        top=df.loc[totals.idxmax()],
+        max_score=float(stats["max"]),
+    )
 
 
+@st.cache_data(ttl=60, show_spinner=False)
+def _kol_index(campaign_id: int) -> tuple[List[str], List[str]]:
+    df = _load_dashboard_df(campaign_id)
+    if df.empty:
+        return [], []
+    names = sorted(df["name"].dropna().unique().tolist())
+    return names, [name.lower() for name in names]
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _dashboard_csv(campaign_id: int, version: str) -> bytes:
+    buffer = io.BytesIO()
+    # Exports full rows (not the grid's narrow float32 frame) so every stored field keeps full precision.
+    pacsv.write_csv(pa.Table.from_pylist(database.list_campaign_influencers(campaign_id)), buffer)
+    return buffer.getvalue()
+
+
+# Figures are cached as shared resources (no pickle round trip per hit); callers must not mutate them.
+@st.cache_resource(max_entries=128, show_spinner=False)
+def _radar_figure(theta: tuple[str, ...], r: tuple[float, ...]) -> go.Figure:
+    radar_fig = go.Figure()
+    radar_fig.add_trace(
+        go.Scatterpolar(
+            r=list(r) + [r[0]],
+            theta=list(theta) + [theta[0]],
+            fill="toself",
+            line=dict(color="#0A6CC2", width=3),
+            hovertemplate="%{theta}: %{r:.1f}<extra></extra>",
+        )
+    )
+    radar_fig.update_layout(
+        polar=dict(
+            radialaxis=dict(range=[0, 5], showticklabels=True, ticks=""),
+            angularaxis=dict(showticklabels=True),
+        ),
+        showlegend=False,
+        margin=dict(l=20, r=20, t=20, b=20),
+    )
+    return radar_fig
+
+
+@st.cache_resource(max_entries=32, show_spinner=False)
+def _bar_figure(payload: tuple[tuple[str, float, str], ...], max_score: float) -> go.Figure:
+    chart_df = pd.DataFrame(list(payload), columns=["name", "total_score", "platform"])
+    fig = px.bar(
+        chart_df,
+        x="name",
+        y="total_score",
+        color="platform",
+        text="total_score",
+        color_discrete_sequence=VERO_COLORWAY,
+    )
+    fig.update_traces(
+        texttemplate="%{text:.1f}",
+        textposition="outside",
+        hovertemplate="<b>%{x}</b><br>Total score: %{y:.2f}<extra></extra>",
+    )
+    fig.update_layout(
+        plot_bgcolor="rgba(0,0,0,0)",
+        paper_bgcolor="rgba(0,0,0,0)",
+        font=dict(color="#0A223A", family="TT Commons Pro, Inter, sans-serif"),
+        margin=dict(l=10, r=10, t=15, b=40),
+        yaxis=dict(range=[0, max(5.0, min(35.0, max_score + 2))]),
+        showlegend=True,
+    )
+    return fig
+
+
+def _clear_dashboard_caches() -> None:
+    _load_dashboard_df.clear()
+    _dashboard_aggregates.clear()
+    _kol_index.clear()
+    _dashboard_csv.clear()
 
-def render_dashboard_tab() -> None:
-    user = st.session_state.user
-    campaigns = database.list_campaigns_for_user(user["id"])
-    if not campaigns:
-        st.info("No campaigns yet. Create one first.")
-        return
 
-    def _market_label(c: Dict[str, Any]) -> str:
-        return c.get("market") or "Unspecified"
+def _market_label(campaign: Dict[str, Any]) -> str:
+    return campaign.get("market") or "Unspecified"
 
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _campaigns_and_markets(user_id: int) -> tuple[List[Dict[str, Any]], List[str]]:
+    campaigns = database.list_campaigns_for_user(user_id)
     markets = sorted({_market_label(c) for c in campaigns})
-    with tv_card("Dashboard filters", "Slice performance by market, campaign, and KOL.", badge="Filters"):
-        filter_cols = st.columns(2)
-        with filter_cols[0]:
-            market_choice = st.selectbox(
-                "Market",
-                ["All markets"] + markets,
-                key="dash_market_filter",
-            )
-        filtered_campaigns = [
-            c for c in campaigns if market_choice == "All markets" or _market_label(c) == market_choice
-        ]
-        if not filtered_campaigns:
-            st.info("No campaigns match this market filter.")
-            return
-        label_map = {
-            f"{c['name']} ({_market_label(c)})": c for c in filtered_campaigns
-        }
-        campaign_labels = list(label_map.keys())
-        default_label = campaign_labels[0]
-        active_id = st.session_state.get("active_campaign_id")
-        if active_id:
-            for label, campaign in label_map.items():
-                if campaign["id"] == active_id:
-                    default_label = label
-                    break
-        with filter_cols[1]:
-            campaign_label = st.selectbox(
-                "Campaign",
-                campaign_labels,
-                index=campaign_labels.index(default_label),
-                key="dash_campaign_filter",
-            )
-    selected_campaign = label_map[campaign_label]
-    rows = database.list_dashboard_rows(selected_campaign["id"])
-    if not rows:
-        st.info("No scored KOLs yet for this campaign.")
-        return
-    df = pd.DataFrame(rows)
-    section_heading(
-        f"True Vibe dashboard • {selected_campaign['name']}",
-        "Monitor momentum at a glance and export the scoring grid for stakeholders.",
-    )
+    return campaigns, markets
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def _campaign_label_map(
+    user_id: int,
+    market_choice: str,
+) -> tuple[Dict[str, Dict[str, Any]], List[str], Dict[int, int]]:
+    campaigns, _ = _campaigns_and_markets(user_id)
+    label_map = {
+        f"{c['name']} ({_market_label(c)})": c
+        for c in campaigns
+        if market_choice == "All markets" or _market_label(c) == market_choice
+    }
+    labels = list(label_map.keys())
+    index_by_id: Dict[int, int] = {}
+    for idx, label in enumerate(labels):
+        index_by_id.setdefault(label_map[label]["id"], idx)
+    return label_map, labels, index_by_id
 
+
+@st.fragment
+def _kol_focus_fragment(campaign_id: int, aggregates: SimpleNamespace) -> None:
+    df = aggregates.df
     search = st.text_input("Search KOLs", placeholder="Search by name", key="dash_kol_search")
-    kol_options = sorted(df["name"].dropna().unique().tolist())
-    filtered_names = [name for name in kol_options if search.lower() in name.lower()]
+    query = search.lower()
+    kol_names, kol_names_lower = _kol_index(campaign_id)
+    filtered_names = [name for name, lowered in zip(kol_names, kol_names_lower) if query in lowered]
     selected_names = st.multiselect(
         "Focus KOL(s)",
         options=filtered_names,
@@ -1697,12 +1878,11 @@ def render_dashboard_tab() -> None:
         if not filtered.empty:
             selected_row = filtered.iloc[0]
 
-    completed = df["total_score"].notnull().sum()
+    completed = aggregates.completed
     total_records = len(df)
     completion_pct = (completed / total_records) * 100 if total_records else 0
-    scored_df = df.dropna(subset=["total_score"])
-    avg_total = scored_df["total_score"].mean() if not scored_df.empty else None
-    top_row = scored_df.sort_values("total_score", ascending=False).iloc[0] if not scored_df.empty else None
+    avg_total = aggregates.avg
+    top_row = aggregates.top
 
     with tv_card("Progress overview", "Key performance signals across the roster.", badge="Snapshot"):
         metric_cols = st.columns(3)
@@ -1726,34 +1906,14 @@ def render_dashboard_tab() -> None:
         if selected_row is None:
             st.info("Select at least one KOL above to preview the radar visualization.")
         else:
-            categories = [
-                ("Reach", selected_row.get("reach_score")),
-                ("Interest", selected_row.get("interest_score")),
-                ("Engagement", selected_row.get("engagement_score")),
-                ("Content", selected_row.get("content_score")),
-                ("Authority", selected_row.get("authority_score")),
-                ("Values", selected_row.get("values_score")),
-            ]
-            r = [max(0.0, min(5.0, float(value or 0.0))) for _, value in categories]
-            theta = [label for label, _ in categories]
-            radar_fig = go.Figure()
-            radar_fig.add_trace(
-                go.Scatterpolar(
-                    r=r + [r[0]],
-                    theta=theta + [theta[0]],
-                    fill="toself",
-                    line=dict(color="#0A6CC2", width=3),
-                    hovertemplate="%{theta}: %{r:.1f}<extra></extra>",
-                )
-            )
-            radar_fig.update_layout(
-                polar=dict(
-                    radialaxis=dict(range=[0, 5], showticklabels=True, ticks=""),
-                    angularaxis=dict(showticklabels=True),
-                ),
-                showlegend=False,
-                margin=dict(l=20, r=20, t=20, b=20),
+            values = np.fromiter(
+                (selected_row.get(column) or 0.0 for _, column in RADAR_CATEGORIES),
+                dtype=float,
+                count=len(RADAR_CATEGORIES),
             )
+            clamped = np.clip(np.nan_to_num(values), 0.0, 5.0)
+            r = clamped.tolist()
+            radar_fig = _radar_figure(RADAR_LABELS, tuple(r))
             radar_cols = st.columns([2, 1])
             radar_cols[0].plotly_chart(radar_fig, use_container_width=True, config={"displayModeBar": False})
             with radar_cols[1]:
@@ -1763,58 +1923,63 @@ def render_dashboard_tab() -> None:
                 )
                 st.caption("TrueVibe total score")
                 metric_grid = st.columns(2)
-                for idx, (label, value) in enumerate(categories):
-                    metric_grid[idx % 2].metric(label, f"{value or 0:.1f}")
+                for idx, (label, value) in enumerate(zip(RADAR_LABELS, r)):
+                    metric_grid[idx % 2].metric(label, f"{value:.1f}")
 
-    with tv_card("Score comparison", "Stack-ranked total scores by platform.", badge="Visualization"):
-        if not scored_df.empty:
-            chart_df = scored_df.sort_values("total_score", ascending=False)
-            fig = px.bar(
-                chart_df,
-                x="name",
-                y="total_score",
-                color="platform",
-                text="total_score",
-                color_discrete_sequence=VERO_COLORWAY,
+
+def render_dashboard_tab() -> None:
+    user = st.session_state.user
+    campaigns, markets = _campaigns_and_markets(user["id"])
+    if not campaigns:
+        st.info("No campaigns yet. Create one first.")
+        return
+    with tv_card("Dashboard filters", "Slice performance by market, campaign, and KOL.", badge="Filters"):
+        filter_cols = st.columns(2)
+        with filter_cols[0]:
+            market_choice = st.selectbox(
+                "Market",
+                ["All markets"] + markets,
+                key="dash_market_filter",
             )
-            fig.update_traces(
-                texttemplate="%{text:.1f}",
-                textposition="outside",
-                hovertemplate="<b>%{x}</b><br>Total score: %{y:.2f}<extra></extra>",
+        label_map, campaign_labels, index_by_id = _campaign_label_map(user["id"], market_choice)
+        if not label_map:
+            st.info("No campaigns match this market filter.")
+            return
+        default_index = index_by_id.get(st.session_state.get("active_campaign_id"), 0)
+        with filter_cols[1]:
+            campaign_label = st.selectbox(
+                "Campaign",
+                campaign_labels,
+                index=default_index,
+                key="dash_campaign_filter",
             )
-            max_score = float(chart_df["total_score"].max())
-            fig.update_layout(
-                plot_bgcolor="rgba(0,0,0,0)",
-                paper_bgcolor="rgba(0,0,0,0)",
-                font=dict(color="#0A223A", family="TT Commons Pro, Inter, sans-serif"),
-                margin=dict(l=10, r=10, t=15, b=40),
-                yaxis=dict(range=[0, max(5.0, min(35.0, max_score + 2))]),
-                showlegend=True,
+    selected_campaign = label_map[campaign_label]
+    aggregates = _dashboard_aggregates(selected_campaign["id"])
+    df = aggregates.df
+    if df.empty:
+        st.info("No scored KOLs yet for this campaign.")
+        return
+    section_heading(
+        f"True Vibe dashboard • {selected_campaign['name']}",
+        "Monitor momentum at a glance and export the scoring grid for stakeholders.",
+    )
+
+    _kol_focus_fragment(selected_campaign["id"], aggregates)
+
+    scored_df = aggregates.scored
+    with tv_card("Score comparison", "Stack-ranked total scores by platform.", badge="Visualization"):
+        if not scored_df.empty:
+            bar_payload = tuple(
+                scored_df[["name", "total_score", "platform"]].itertuples(index=False, name=None)
             )
+            fig = _bar_figure(bar_payload, aggregates.max_score)
             st.plotly_chart(fig, use_container_width=True, config={"displayModeBar": False})
         else:
             st.info("Once at least one creator is fully scored, a chart will appear here.")
 
     with tv_card("Score breakdown", "Full grid of underlying metrics and export.", badge="Data"):
-        st.dataframe(
-            df[
-                [
-                    "name",
-                    "platform",
-                    "follower_count",
-                    "reach_score",
-                    "interest_score",
-                    "engagement_score",
-                    "content_score",
-                    "authority_score",
-                    "values_score",
-                    "total_score",
-                    "updated_at",
-                ]
-            ],
-            use_container_width=True,
-        )
-        csv = df.to_csv(index=False).encode("utf-8")
+        st.dataframe(df.loc[:, DASHBOARD_COLS], use_container_width=True)
+        csv = _dashboard_csv(selected_campaign["id"], str(df["updated_at"].max()))
         st.download_button("Download CSV", data=csv, file_name="truevibe_dashboard.csv", mime="text/csv")
 
 
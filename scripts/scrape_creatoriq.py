@@ -60,8 +60,8 @@ def main() -> None:
         sys.exit(1)
     count = summary.get("count", 0)
     print(f"Imported {count} creator(s) using {mode_used}.")
-    for warning in summary.get("warnings", []):
-        print(f"Warning: {warning}")
+    if summary.get("warning"):
+        print(f"Warning: {summary['warning']} ({summary.get('skipped', 0)} creator(s) affected)")
 
 
 if __name__ == "__main__":
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
 import argparse
-import random
-from typing import Dict, List
-
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Dict, List
+
+import numpy as np
 
 PROJECT_ROOT = Path(__file__).resolve().parents[1]
 if str(PROJECT_ROOT) not in sys.path:
@@ -52,10 +53,10 @@ def ensure_campaign(
     market: str,
     objective: str,
 ) -> Dict[str, str]:
-    for campaign in database.list_campaigns_for_user(owner_user_id):
-        if campaign["name"].lower() == name.lower():
-            print(f"[seed] Reusing existing campaign '{name}' (id={campaign['id']}).")
-            return campaign
+    campaign = database.get_campaign_by_name(owner_user_id, name)
+    if campaign:
+        print(f"[seed] Reusing existing campaign '{name}' (id={campaign['id']}).")
+        return campaign
     campaign_id = database.create_campaign(
         owner_user_id=owner_user_id,
         name=name,
@@ -67,35 +68,39 @@ def ensure_campaign(
     return database.get_campaign(campaign_id)  # type: ignore[return-value]
 
 
-def generate_score_payload() -> Dict[str, float | str]:
-    reach = random.uniform(2.5, 4.8)
-    interest = random.uniform(2.5, 4.8)
-    engagement_rate = round(random.uniform(1.5, 6.0), 2)
-    engagement_score = random.uniform(2.5, 4.8)
-    originality = random.uniform(2.5, 4.8)
-    creativity = random.uniform(2.5, 4.8)
-    authority = random.uniform(2.5, 4.8)
-    values = random.uniform(2.5, 4.8)
-    notes = "Auto-seeded sample entry for demo purposes."
-    return scoring.build_score_payload(
-        reach_score=reach,
-        interest_score=interest,
-        engagement_rate=engagement_rate,
-        engagement_score=engagement_score,
-        content_originality=originality,
-        content_creativity=creativity,
-        authority_overall=authority,
-        values_overall=values,
-        qualitative_notes=notes,
-    )
+SCORE_INPUT_KEYS = (
+    "reach_score",
+    "interest_score",
+    "engagement_score",
+    "content_originality",
+    "content_creativity",
+    "authority_overall",
+    "values_overall",
+)
+SEED_NOTE = "Auto-seeded sample entry for demo purposes."
+
+
+def generate_score_payloads(n: int) -> List[scoring.ScorePayload]:
+    rng = np.random.default_rng()
+    block = rng.uniform(2.5, 4.8, size=(n, len(SCORE_INPUT_KEYS)))
+    rates = np.round(rng.uniform(1.5, 6.0, size=n), 2)
+    return [
+        scoring.build_score_payload(
+            **dict(zip(SCORE_INPUT_KEYS, row.tolist())),
+            engagement_rate=float(rate),
+            qualitative_notes=SEED_NOTE,
+        )
+        for row, rate in zip(block, rates)
+    ]
 
 
 def seed_influencers(campaign_id: int, publish_links: List[str]) -> None:
-    for link in publish_links:
-        profile = scraping.fetch_kol_profile(link)
-        influencer = database.upsert_influencer(profile)
-        join_row = database.ensure_campaign_influencer(campaign_id, influencer["id"])
-        payload = {
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        profiles = list(executor.map(scraping.fetch_kol_profile, publish_links))
+    score_payloads = generate_score_payloads(len(profiles))
+    records = []
+    for link, profile, scores in zip(publish_links, profiles, score_payloads):
+        source_payload = {
             "profiles": [
                 {
                     "Full Name": profile.get("name"),
@@ -108,18 +113,20 @@ def seed_influencers(campaign_id: int, publish_links: List[str]) -> None:
                 }
             ]
         }
-        database.add_kol_source(
-            campaign_id=campaign_id,
-            publish_link=link,
-            platform=profile["platform"],
-            payload=payload,
-            status="seeded",
+        records.append(
+            {
+                "profile": profile,
+                "publish_link": link,
+                "source_payload": source_payload,
+                "status": "seeded",
+                "scores": scores.as_dict(),
+            }
         )
-        payload = generate_score_payload()
-        database.save_campaign_influencer_scores(join_row["campaign_influencer_id"], payload)
+    influencers = database.bulk_seed_influencers(campaign_id, records)
+    for influencer, record in zip(influencers, records):
         print(
             f"[seed] Added {influencer['name']} ({influencer['platform']}) "
-            f"to campaign_id={campaign_id} with total score {payload['total_score']}."
+            f"to campaign_id={campaign_id} with total score {record['scores']['total_score']}."
         )
 
 
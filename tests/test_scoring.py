@@ -0,0 +1,42 @@
+import sys
+import unicodedata
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from truevibe import scoring  # noqa: E402
+
+
+def test_cyrillic_objective_counts_overlap():
+    assert scoring.keyword_overlap("красота уход кожа", "уход за кожей, красота") == 2
+    assert scoring.estimate_interest_score("красота уход кожа", "уход за кожей, красота") == 4.0
+
+
+def test_vietnamese_objective_counts_overlap():
+    topics = "làm đẹp chăm sóc da mặt"
+    objective = "chiến dịch chăm sóc làm đẹp"
+    assert scoring.keyword_overlap(topics, objective) == 3
+    assert scoring.estimate_interest_score(topics, objective) == 5.0
+
+
+def test_decomposed_accents_match_precomposed():
+    topics = unicodedata.normalize("NFD", "chăm sóc làm đẹp")
+    assert scoring.estimate_interest_score(topics, "chăm sóc làm đẹp") == 5.0
+
+
+def test_stopword_only_text_falls_back_to_neutral():
+    assert scoring.keyword_overlap("the and for with", "the and for with") == -1
+    assert scoring.estimate_interest_score("the and for with", "the and for with") == 3.0
+
+
+def test_english_overlap_tiers():
+    assert scoring.estimate_interest_score("beauty", "travel food") == 2.5
+    assert scoring.estimate_interest_score("beauty skincare", "Beauty skincare routine") == 4.0
+    assert scoring.estimate_interest_score("one two three four five", "one two three four five") == 5.0
+
+
+def test_missing_keywords_fall_back_to_neutral():
+    assert scoring.estimate_interest_score("beauty", None) == 3.0
+    assert scoring.estimate_interest_score("a b c d e", "beauty") == 3.0
@@ -6,9 +6,11 @@ from dataclasses import dataclass
 from typing import Dict, Iterable, List, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
 
 
 CREATORIQ_GRAPHQL_URL = "https://app.creatoriq.com/api/collections/graphql"
+_SLUG_RE = re.compile(r"/lists/report/([^/?#]+)")
 
 
 GET_COLLECTION_CREATORS_QUERY = """
@@ -136,12 +138,22 @@ query getCollectionCreatorDetails($filterBy: ListDataFilter, $creatorId: ID!) {
 """
 
 
+def _build_session() -> requests.Session:
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=20))
+    return session
+
+
+# Shared across clients so repeated calls reuse pooled keep-alive connections.
+_SESSION = _build_session()
+
+
 class CreatorIQError(RuntimeError):
     """Raised when CreatorIQ API returns an error."""
 
 
 def extract_slug(publish_link: str) -> str:
-    match = re.search(r"/lists/report/([^/?#]+)", publish_link)
+    match = _SLUG_RE.search(publish_link)
     if not match:
         raise ValueError("Unable to extract CreatorIQ share slug from the provided URL.")
     return match.group(1)
@@ -157,12 +169,9 @@ class CreatorRecord:
     detail: Optional[Dict[str, object]] = None
 
     def merged(self) -> Dict[str, object]:
-        payload: Dict[str, object] = {}
-        for source in (self.data or {}, self.detail or {}):
-            for key, value in source.items():
-                if value is None:
-                    continue
-                payload[key] = value
+        # Filter each side before merging so a None in `detail` never masks a value from `data`.
+        payload = {key: value for key, value in (self.data or {}).items() if value is not None}
+        payload.update((key, value) for key, value in (self.detail or {}).items() if value is not None)
         return payload
 
 
@@ -176,9 +185,16 @@ class CreatorIQClient:
 
     def __init__(self, slug: str, session: Optional[requests.Session] = None, timeout: int = 20) -> None:
         self.slug = slug
-        self.session = session or requests.Session()
+        self.session = session or _SESSION
         self.timeout = timeout
         self._list_id: Optional[str] = None
+        self._headers = {
+            "Authorization": f"Report {self.slug}",
+            "Content-Type": "application/json",
+            "Accept": "application/graphql-response+json,application/json;q=0.9",
+            "Origin": "https://vero.creatoriq.com",
+            "Referer": "https://vero.creatoriq.com/",
+        }
 
     def _graphql(self, operation_name: str, query: str, variables: Optional[Dict[str, object]] = None) -> Dict[str, object]:
         payload = {
@@ -187,17 +203,10 @@ class CreatorIQClient:
             "extensions": {"clientLibrary": {"name": "@apollo/client", "version": "4.0.9"}},
             "query": query,
         }
-        headers = {
-            "Authorization": f"Report {self.slug}",
-            "Content-Type": "application/json",
-            "Accept": "application/graphql-response+json,application/json;q=0.9",
-            "Origin": "https://vero.creatoriq.com",
-            "Referer": "https://vero.creatoriq.com/",
-        }
         response = self.session.post(
             CREATORIQ_GRAPHQL_URL,
-            data=json.dumps(payload),
-            headers=headers,
+            data=json.dumps(payload, separators=(",", ":")),
+            headers=self._headers,
             timeout=self.timeout,
         )
         if response.status_code >= 400:
@@ -1,10 +1,15 @@
 from __future__ import annotations
 
+import os
+import queue
 import re
 import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Dict, List, Optional, Sequence, Set
 
 from selenium import webdriver
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
@@ -26,12 +31,43 @@ SEARCH_INPUT_SELECTOR = 'input[placeholder="Search by name or @account..."]'
 PROFILE_RESULT_CARD_SELECTOR = ".CreatorCard-module__root.MuiBox-root.css-75qv9u"
 PROFILE_DETAILS_ROOT_SELECTOR = '[data-testid="creator-details-sidebar-root"]'
 
+# Reads every visible card in-page so each pass over the feed costs one WebDriver round trip.
+PROFILE_CARDS_SCRIPT = """
+const [cardSel, nameSel, handleSel, avatarSel, stackSel, iconSel, followerSel, bioSel] = arguments;
+const text = (node) => (node ? node.innerText.trim() : null);
+return Array.from(document.querySelectorAll(cardSel), (card) => {
+    const name = card.querySelector(nameSel);
+    const handle = card.querySelector(handleSel);
+    const avatar = card.querySelector(avatarSel);
+    if (!name || !handle || !avatar) {
+        return null;
+    }
+    const stack = card.querySelector(stackSel);
+    const icon = stack ? stack.querySelector(iconSel) : null;
+    const followers = stack ? stack.querySelector(followerSel) : null;
+    const bio = card.querySelector(bioSel);
+    return {
+        name: text(name),
+        handle: text(handle),
+        image: avatar.getAttribute("src"),
+        iconClass: icon && followers ? icon.getAttribute("class") : null,
+        followers: icon && followers ? text(followers) : "",
+        bio: bio ? text(bio) : "N/A",
+    };
+});
+"""
+
 
 PLATFORM_CLASS_MAP = {
     "ciq-instagram-logo": "Instagram",
     "ciq-tiktok-logo": "TikTok",
     "ciq-youtube-logo": "YouTube",
 }
+_PLATFORM_KEYS = frozenset(PLATFORM_CLASS_MAP)
+
+_FOLLOWER_RE = re.compile(r"([0-9]+(?:\.[0-9]+)?)\s*([kmbKMB]?)")
+_NON_DIGIT = re.compile(r"\D")
+_MULT = {"": 1, "K": 1_000, "M": 1_000_000, "B": 1_000_000_000}
 
 
 def build_driver(headless: bool = True) -> webdriver.Chrome:
@@ -47,27 +83,70 @@ def build_driver(headless: bool = True) -> webdriver.Chrome:
     return driver
 
 
-def scroll_page(driver: webdriver.Chrome, scroll_pause_time: float = 1, scroll_step: int = 300) -> bool:
+# Scrolls in-page until the feed stops growing (resolves true) or the spotlight section shows (resolves false).
+SCROLL_FEED_SCRIPT = """
+const [step, pauseMs, spotlightSel, done] = arguments;
+// Each call takes a fresh run id; bumping window.__tvScrollRun (see SCROLL_CANCEL_SCRIPT) stops older loops.
+const run = (window.__tvScrollRun = (window.__tvScrollRun || 0) + 1);
+const cancelled = () => window.__tvScrollRun !== run;
+let last = document.body.scrollHeight;
+const scrollOnce = () => {
+    if (cancelled()) return;
+    window.scrollBy(0, step);
+    const deadline = performance.now() + pauseMs * 2;
+    const waitForGrowth = () => {
+        if (cancelled()) return;
+        const height = document.body.scrollHeight;
+        if (height !== last) {
+            last = height;
+            const spotlight = document.querySelector(spotlightSel);
+            if (spotlight && spotlight.getClientRects().length) {
+                done(false);
+            } else {
+                requestAnimationFrame(scrollOnce);
+            }
+        } else if (performance.now() >= deadline) {
+            done(true);
+        } else {
+            setTimeout(waitForGrowth, 150);
+        }
+    };
+    requestAnimationFrame(waitForGrowth);
+};
+scrollOnce();
+"""
+SCROLL_CANCEL_SCRIPT = "window.__tvScrollRun = (window.__tvScrollRun || 0) + 1;"
+
+
+def scroll_page(
+    driver: webdriver.Chrome,
+    scroll_pause_time: float = 1,
+    scroll_step: int = 300,
+    timeout: float = 30,
+) -> bool:
     """
     Scroll the page gradually until new content loads. Returns True when the bottom of the page was reached.
     """
-    last_height = driver.execute_script("return document.body.scrollHeight")
-    while True:
-        driver.execute_script("window.scrollBy(0, arguments[0]);", scroll_step)
-        time.sleep(scroll_pause_time)
-        new_height = driver.execute_script("return document.body.scrollHeight")
-        if new_height == last_height:
-            print("Reached the bottom of the page.")
-            return True
-        last_height = new_height
+    driver.set_script_timeout(timeout)
+    try:
+        reached_bottom = driver.execute_async_script(
+            SCROLL_FEED_SCRIPT,
+            scroll_step,
+            scroll_pause_time * 1000,
+            SPOTLIGHT_SECTION_SELECTOR,
+        )
+    except TimeoutException:
+        # The in-page loop outlives the WebDriver timeout; stop it before the next scrape step.
         try:
-            spotlight_section = driver.find_element(By.CSS_SELECTOR, SPOTLIGHT_SECTION_SELECTOR)
-            if spotlight_section.is_displayed():
-                print("Continue to scroll.")
-                break
-        except Exception:
-            pass
-    return False
+            driver.execute_script(SCROLL_CANCEL_SCRIPT)
+        except Exception as exc:
+            print(f"Error cancelling scroll loop: {exc}")
+        return False
+    if reached_bottom:
+        print("Reached the bottom of the page.")
+    else:
+        print("Continue to scroll.")
+    return bool(reached_bottom)
 
 
 def wait_for_profile_growth(
@@ -79,38 +158,72 @@ def wait_for_profile_growth(
     """
     After scrolling, wait for new cards to render. Returns True if additional profiles appear.
     """
-    for _ in range(max_attempts):
-        time.sleep(delay)
-        current_count = len(driver.find_elements(By.CSS_SELECTOR, PROFILE_CARD_SELECTOR))
-        if current_count > previous_count:
-            return True
-    return False
+    try:
+        WebDriverWait(driver, delay * max_attempts, poll_frequency=0.25).until(_profile_count_above(previous_count))
+    except TimeoutException:
+        return False
+    return True
+
+
+def _profile_count_above(previous_count: int):
+    return lambda d: len(d.find_elements(By.CSS_SELECTOR, PROFILE_CARD_SELECTOR)) > previous_count
 
 
 def get_platform_from_icon(platform_class: str) -> str:
-    for class_name, platform in PLATFORM_CLASS_MAP.items():
-        if class_name in platform_class:
-            return platform
-    return "Unknown"
+    hit = _PLATFORM_KEYS.intersection((platform_class or "").split())
+    return PLATFORM_CLASS_MAP[next(iter(hit))] if hit else "Unknown"
 
 
+@lru_cache(maxsize=4096)
 def parse_follower_count(raw_value: str) -> Optional[int]:
     if not raw_value:
         return None
     normalized = raw_value.replace(",", "").strip()
-    match = re.match(r"([0-9]+(?:\.[0-9]+)?)\s*([KMB]?)", normalized, re.IGNORECASE)
+    if normalized.isdecimal():
+        return int(normalized)
+    match = _FOLLOWER_RE.match(normalized)
     if not match:
-        digits = re.sub(r"\D", "", normalized)
+        digits = _NON_DIGIT.sub("", normalized)
         return int(digits) if digits else None
     number = float(match.group(1))
-    suffix = match.group(2).upper()
-    multiplier = {"": 1, "K": 1_000, "M": 1_000_000, "B": 1_000_000_000}.get(suffix, 1)
-    return int(number * multiplier)
+    return int(number * _MULT[match.group(2).upper()])
 
 
 class CreatorIQDomScraper:
-    def __init__(self, headless: bool = True) -> None:
+    def __init__(
+        self,
+        headless: bool = True,
+        detail_workers: Optional[int] = None,
+        reuse_driver: bool = False,
+    ) -> None:
         self.headless = headless
+        self.detail_workers = detail_workers
+        self.reuse_driver = reuse_driver
+        self.runs = 0
+        self._driver: Optional[webdriver.Chrome] = None
+        # Extra detail-page browsers, kept alongside `_driver` when reuse_driver is set.
+        self._detail_drivers: List[webdriver.Chrome] = []
+
+    def close(self) -> None:
+        """
+        Quit the kept-alive drivers, if any.
+        """
+        drivers, self._detail_drivers = self._detail_drivers, []
+        if self._driver is not None:
+            drivers.append(self._driver)
+            self._driver = None
+        for driver in drivers:
+            try:
+                driver.quit()
+            except Exception as exc:
+                print(f"Error closing driver: {exc}")
+
+    def _acquire_driver(self) -> webdriver.Chrome:
+        if not self.reuse_driver:
+            return build_driver(headless=self.headless)
+        if self._driver is None:
+            self._driver = build_driver(headless=self.headless)
+        return self._driver
 
     def scrape_report(
         self,
@@ -118,22 +231,31 @@ class CreatorIQDomScraper:
         max_profiles: int = 100,
         detail_limit: Optional[int] = None,
     ) -> List[Dict[str, object]]:
-        driver = build_driver(headless=self.headless)
+        self.runs += 1
+        driver = self._acquire_driver()
+        failed = True
         try:
             profiles = self._scrape_profiles(driver, url, max_profiles=max_profiles)
+            if profiles:
+                limit = len(profiles) if detail_limit is None else min(len(profiles), detail_limit)
+                if limit > 0:
+                    self._attach_profile_details(driver, url, profiles, limit)
+            failed = False
         finally:
-            driver.quit()
-        if not profiles:
-            return []
-        limit = len(profiles) if detail_limit is None else min(len(profiles), detail_limit)
-        if limit > 0:
-            detail_driver = build_driver(headless=self.headless)
-            try:
-                self._attach_profile_details(detail_driver, url, profiles, limit)
-            finally:
-                detail_driver.quit()
+            # Kept-alive drivers survive successful runs only; after an error their session state is suspect.
+            if not self.reuse_driver:
+                driver.quit()
+            elif failed:
+                self.close()
         return profiles
 
+    def _detail_worker_count(self, task_count: int) -> int:
+        workers = self.detail_workers
+        if workers is None:
+            # A pooled scraper stays on its warm browser rather than launching cold ones per run.
+            workers = 1 if self.reuse_driver else min(8, os.cpu_count() or 2)
+        return max(1, min(workers, task_count))
+
     def _scrape_profiles(
         self,
         driver: webdriver.Chrome,
@@ -141,18 +263,20 @@ class CreatorIQDomScraper:
         max_profiles: int,
     ) -> List[Dict[str, object]]:
         driver.get(url)
-        time.sleep(10)
+        try:
+            WebDriverWait(driver, 10).until(EC.presence_of_element_located((By.CSS_SELECTOR, PROFILE_CARD_SELECTOR)))
+        except TimeoutException:
+            print("No profile cards rendered within 10s.")
         profiles_data: List[Dict[str, object]] = []
         unique_handles: Set[str] = set()
         total_scraped = 0
         reached_bottom_last = False
 
         while total_scraped < max_profiles:
-            profile_elements = driver.find_elements(By.CSS_SELECTOR, PROFILE_CARD_SELECTOR)
-            visible_count = len(profile_elements)
+            cards = self._read_profile_cards(driver)
+            visible_count = len(cards)
             print(f"Found {visible_count} profiles on this page")
-            for element in profile_elements:
-                data = self._extract_profile_card(element)
+            for data in cards:
                 if not data:
                     continue
                 handle = data.get("Handle")
@@ -183,32 +307,35 @@ class CreatorIQDomScraper:
             print(f"Scraping complete. Total unique profiles found: {total_scraped}")
         return profiles_data
 
-    def _extract_profile_card(self, profile_element) -> Optional[Dict[str, str]]:
+    def _read_profile_cards(self, driver: webdriver.Chrome) -> List[Optional[Dict[str, str]]]:
         try:
-            fullname = profile_element.find_element(By.CSS_SELECTOR, PROFILE_NAME_SELECTOR).text
-            handle = profile_element.find_element(By.CSS_SELECTOR, PROFILE_HANDLE_SELECTOR).text
-            image_url = profile_element.find_element(By.CSS_SELECTOR, PROFILE_AVATAR_SELECTOR).get_attribute("src")
-        except Exception:
+            cards = driver.execute_script(
+                PROFILE_CARDS_SCRIPT,
+                PROFILE_CARD_SELECTOR,
+                PROFILE_NAME_SELECTOR,
+                PROFILE_HANDLE_SELECTOR,
+                PROFILE_AVATAR_SELECTOR,
+                PROFILE_PLATFORM_STACK_SELECTOR,
+                PROFILE_PLATFORM_ICON_SELECTOR,
+                PROFILE_FOLLOWER_SELECTOR,
+                PROFILE_BIO_SELECTOR,
+            )
+        except Exception as exc:
+            print(f"Error reading profile cards: {exc}")
+            return []
+        return [self._extract_profile_card(fields) for fields in cards or []]
+
+    def _extract_profile_card(self, fields: Optional[Dict[str, str]]) -> Optional[Dict[str, str]]:
+        if not fields:
             return None
-        try:
-            platform_element = profile_element.find_element(By.CSS_SELECTOR, PROFILE_PLATFORM_STACK_SELECTOR)
-            platform_icon_class = platform_element.find_element(By.CSS_SELECTOR, PROFILE_PLATFORM_ICON_SELECTOR).get_attribute("class")
-            platform = get_platform_from_icon(platform_icon_class)
-            followers = platform_element.find_element(By.CSS_SELECTOR, PROFILE_FOLLOWER_SELECTOR).text
-        except Exception:
-            platform = "Unknown"
-            followers = ""
-        try:
-            bio = profile_element.find_element(By.CSS_SELECTOR, PROFILE_BIO_SELECTOR).text
-        except Exception:
-            bio = "N/A"
+        icon_class = fields.get("iconClass")
         return {
-            "Full Name": fullname,
-            "Handle": handle,
-            "Image URL": image_url,
-            "Platform": platform,
-            "Followers": followers,
-            "Bio": bio,
+            "Full Name": fields.get("name") or "",
+            "Handle": fields.get("handle") or "",
+            "Image URL": fields.get("image"),
+            "Platform": get_platform_from_icon(icon_class) if icon_class else "Unknown",
+            "Followers": fields.get("followers") or "",
+            "Bio": fields.get("bio"),
         }
 
     def _attach_profile_details(
@@ -218,22 +345,80 @@ class CreatorIQDomScraper:
         profiles: Sequence[Dict[str, object]],
         max_profiles: int,
     ) -> None:
-        for profile in profiles[:max_profiles]:
-            handle = str(profile.get("Handle") or "").strip()
-            if not handle:
-                continue
-            print(f"Processing profile: {handle}")
-            success = self.visit_and_search(driver, url, handle)
-            if not success:
-                continue
-            details = self.scrape_profile_details(driver)
-            profile["Details"] = details
+        """
+        Scrape detail sidebars on `driver`, plus extra browsers when more than one detail worker is allowed.
+        """
+        by_handle: Dict[str, Dict[str, object]] = {}
+        for profile in profiles:
+            handle = normalize_handle(str(profile.get("Handle") or ""))
+            if handle and handle not in by_handle:
+                by_handle[handle] = profile
+        order = list(by_handle)[:max_profiles]
+        if not order:
+            return
+
+        workers = self._detail_worker_count(len(order))
+        if workers == 1:
+            for handle in order:
+                details = self.fetch_detail(driver, url, handle)
+                if details is not None:
+                    by_handle[handle]["Details"] = details
+            return
+
+        # Selenium sessions are not thread-safe, so each in-flight fetch checks a browser out of this pool.
+        extra_drivers = self._extra_detail_drivers(workers - 1)
+        available: "queue.Queue[webdriver.Chrome]" = queue.Queue()
+        for worker_driver in [driver, *extra_drivers]:
+            available.put(worker_driver)
+
+        def fetch(handle: str) -> Optional[Dict[str, object]]:
+            worker_driver = available.get()
+            try:
+                return self.fetch_detail(worker_driver, url, handle)
+            finally:
+                available.put(worker_driver)
+
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for handle, details in zip(order, executor.map(fetch, order)):
+                    if details is not None:
+                        by_handle[handle]["Details"] = details
+        finally:
+            if not self.reuse_driver:
+                for worker_driver in extra_drivers:
+                    worker_driver.quit()
+
+    def _extra_detail_drivers(self, count: int) -> List[webdriver.Chrome]:
+        if not self.reuse_driver:
+            drivers: List[webdriver.Chrome] = []
+            try:
+                for _ in range(count):
+                    drivers.append(build_driver(headless=self.headless))
+            except Exception:
+                for worker_driver in drivers:
+                    worker_driver.quit()
+                raise
+            return drivers
+        while len(self._detail_drivers) < count:
+            self._detail_drivers.append(build_driver(headless=self.headless))
+        return self._detail_drivers[:count]
+
+    def fetch_detail(self, driver: webdriver.Chrome, url: str, handle: str) -> Optional[Dict[str, object]]:
+        """
+        Open one creator's detail sidebar on `driver` and scrape it, or return None if the search fails.
+        """
+        print(f"Processing profile: {handle}")
+        if not self.visit_and_search(driver, url, handle):
+            return None
+        return self.scrape_profile_details(driver)
 
     def visit_and_search(self, driver: webdriver.Chrome, url: str, handle: str) -> bool:
         driver.get(url)
-        time.sleep(5)
         clean_handle = handle.lstrip("@")
         try:
+            WebDriverWait(driver, 20).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, PROFILE_CARD_SELECTOR))
+            )
             search_box = WebDriverWait(driver, 20).until(
                 EC.element_to_be_clickable((By.CSS_SELECTOR, SEARCH_ICON_SELECTOR))
             )
@@ -1,16 +1,32 @@
 from __future__ import annotations
 
+import atexit
+import hashlib
 import json
 import sqlite3
+import threading
+import time
+import zlib
 from contextlib import contextmanager
-from datetime import datetime
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Sequence
 
 from .config import get_db_path
 
 
+_now_ts = 0
+_now_str = ""
+
+
 def _now() -> str:
-    return datetime.utcnow().isoformat(timespec="seconds")
+    """
+    UTC timestamp at second resolution, reformatted only when the second changes.
+    """
+    global _now_ts, _now_str
+    ts = int(time.time())
+    if ts != _now_ts:
+        _now_str = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(ts))
+        _now_ts = ts
+    return _now_str
 
 
 def get_connection() -> sqlite3.Connection:
@@ -19,19 +35,58 @@ def get_connection() -> sqlite3.Connection:
     """
     db_path = get_db_path()
     db_path.parent.mkdir(parents=True, exist_ok=True)
-    conn = sqlite3.connect(db_path)
+    # Connections stay owned by one thread; check_same_thread is off only so stale ones can be closed elsewhere.
+    conn = sqlite3.connect(db_path, check_same_thread=False, cached_statements=256)
     conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode = WAL;")
+    conn.execute("PRAGMA synchronous = NORMAL;")
+    conn.execute("PRAGMA temp_store = MEMORY;")
+    conn.execute("PRAGMA cache_size = -20000;")
     conn.execute("PRAGMA foreign_keys = ON;")
     return conn
 
 
+_local = threading.local()
+# Keyed by Thread object rather than ident: idents are recycled once a thread exits.
+_connections: Dict[threading.Thread, sqlite3.Connection] = {}
+_connections_lock = threading.Lock()
+
+
+def _thread_connection() -> sqlite3.Connection:
+    db_path = get_db_path()
+    conn = getattr(_local, "conn", None)
+    if conn is not None and _local.db_path == db_path:
+        return conn
+    if conn is not None:
+        conn.close()
+    conn = get_connection()
+    _local.conn = conn
+    _local.db_path = db_path
+    with _connections_lock:
+        for thread in [thread for thread in _connections if not thread.is_alive()]:
+            _connections.pop(thread).close()
+        _connections[threading.current_thread()] = conn
+    return conn
+
+
+@atexit.register
+def close_connections() -> None:
+    with _connections_lock:
+        while _connections:
+            _connections.popitem()[1].close()
+
+
 @contextmanager
 def session() -> Iterable[sqlite3.Connection]:
-    conn = get_connection()
+    """
+    Yield this thread's cached connection, rolling back any uncommitted work on error.
+    """
+    conn = _thread_connection()
     try:
         yield conn
-    finally:
-        conn.close()
+    except Exception:
+        conn.rollback()
+        raise
 
 
 SCHEMA = """
@@ -55,30 +110,64 @@ CREATE TABLE IF NOT EXISTS campaigns (
     FOREIGN KEY (owner_user_id) REFERENCES users(id) ON DELETE CASCADE
 );
 
+CREATE INDEX IF NOT EXISTS idx_campaigns_owner_lname ON campaigns(owner_user_id, lower(name));
+CREATE INDEX IF NOT EXISTS idx_campaigns_owner_created ON campaigns(owner_user_id, created_at DESC);
+
 CREATE TABLE IF NOT EXISTS kol_sources (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
     campaign_id INTEGER NOT NULL,
     publish_link TEXT NOT NULL,
     platform TEXT,
     status TEXT NOT NULL DEFAULT 'pending',
-    raw_payload TEXT,
+    raw_payload BLOB,
+    payload_hash TEXT,
     created_at TEXT NOT NULL,
     updated_at TEXT NOT NULL,
     UNIQUE (campaign_id, publish_link),
     FOREIGN KEY (campaign_id) REFERENCES campaigns(id) ON DELETE CASCADE
 );
 
+CREATE INDEX IF NOT EXISTS idx_kol_sources_campaign ON kol_sources(campaign_id, created_at DESC);
+
 CREATE TABLE IF NOT EXISTS influencers (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
     name TEXT NOT NULL,
     handle TEXT NOT NULL,
     platform TEXT NOT NULL,
     follower_count INTEGER,
-    demographics_json TEXT,
+    demographics_json TEXT CHECK (json_valid(demographics_json)),
     last_seen_at TEXT NOT NULL,
-    UNIQUE (handle, platform)
+    handle_norm TEXT GENERATED ALWAYS AS (lower(trim(handle))) VIRTUAL
+);
+
+CREATE INDEX IF NOT EXISTS idx_influencers_last_seen ON influencers(last_seen_at DESC);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS influencers_fts USING fts5(
+    name,
+    handle,
+    platform,
+    content='influencers',
+    content_rowid='id',
+    tokenize='unicode61'
 );
 
+CREATE TRIGGER IF NOT EXISTS influencers_fts_ai AFTER INSERT ON influencers BEGIN
+    INSERT INTO influencers_fts (rowid, name, handle, platform)
+    VALUES (new.id, new.name, new.handle, new.platform);
+END;
+
+CREATE TRIGGER IF NOT EXISTS influencers_fts_ad AFTER DELETE ON influencers BEGIN
+    INSERT INTO influencers_fts (influencers_fts, rowid, name, handle, platform)
+    VALUES ('delete', old.id, old.name, old.handle, old.platform);
+END;
+
+CREATE TRIGGER IF NOT EXISTS influencers_fts_au AFTER UPDATE OF name, handle, platform ON influencers BEGIN
+    INSERT INTO influencers_fts (influencers_fts, rowid, name, handle, platform)
+    VALUES ('delete', old.id, old.name, old.handle, old.platform);
+    INSERT INTO influencers_fts (rowid, name, handle, platform)
+    VALUES (new.id, new.name, new.handle, new.platform);
+END;
+
 CREATE TABLE IF NOT EXISTS campaign_influencers (
     id INTEGER PRIMARY KEY AUTOINCREMENT,
     campaign_id INTEGER NOT NULL,
@@ -110,6 +199,8 @@ CREATE TABLE IF NOT EXISTS campaign_influencers (
     FOREIGN KEY (campaign_id) REFERENCES campaigns(id) ON DELETE CASCADE,
     FOREIGN KEY (influencer_id) REFERENCES influencers(id) ON DELETE CASCADE
 );
+
+CREATE INDEX IF NOT EXISTS idx_ci_campaign ON campaign_influencers(campaign_id);
 """
 
 
@@ -118,14 +209,33 @@ def init_db() -> None:
     Initialize the SQLite database with the expected schema.
     """
     with session() as conn:
+        has_fts = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'influencers_fts'"
+        ).fetchone()
         conn.executescript(SCHEMA)
+        _ensure_column(conn, "kol_sources", "payload_hash", "TEXT")
+        _ensure_column(conn, "influencers", "handle_norm", "TEXT GENERATED ALWAYS AS (lower(trim(handle))) VIRTUAL")
+        # Created here rather than in SCHEMA because older databases only gain handle_norm above.
+        conn.execute(
+            "CREATE UNIQUE INDEX IF NOT EXISTS ux_influencers_handle_norm ON influencers(handle_norm, platform)"
+        )
+        if not has_fts:
+            # Backfill the search index for databases created before it existed.
+            conn.execute("INSERT INTO influencers_fts (influencers_fts) VALUES ('rebuild')")
         conn.commit()
 
 
+def _ensure_column(conn: sqlite3.Connection, table: str, column: str, declaration: str) -> None:
+    """
+    Add a column to tables created before it joined SCHEMA.
+    """
+    existing = {row["name"] for row in conn.execute(f"PRAGMA table_xinfo({table})")}
+    if column not in existing:
+        conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {declaration}")
+
+
 def _row_to_dict(row: Optional[sqlite3.Row]) -> Optional[Dict[str, Any]]:
-    if row is None:
-        return None
-    return {key: row[key] for key in row.keys()}
+    return None if row is None else dict(row)
 
 
 def create_user(email: str, full_name: str, password_hash: str, role: str = "analyst") -> int:
@@ -174,7 +284,7 @@ def list_campaigns_for_user(owner_user_id: int) -> List[Dict[str, Any]]:
             """,
             (owner_user_id,),
         )
-        return [_row_to_dict(row) for row in cur.fetchall()]
+        return [dict(row) for row in cur]
 
 
 def get_campaign(campaign_id: int) -> Optional[Dict[str, Any]]:
@@ -183,22 +293,70 @@ def get_campaign(campaign_id: int) -> Optional[Dict[str, Any]]:
         return _row_to_dict(cur.fetchone())
 
 
-def add_kol_source(campaign_id: int, publish_link: str, platform: str, payload: Dict[str, Any], status: str = "ingested") -> None:
-    now = _now()
-    serialized_payload = json.dumps(payload)
+def get_campaign_by_name(owner_user_id: int, name: str) -> Optional[Dict[str, Any]]:
+    """
+    Case-insensitive campaign lookup for a single owner.
+    """
     with session() as conn:
-        conn.execute(
-            """
-            INSERT INTO kol_sources (campaign_id, publish_link, platform, status, raw_payload, created_at, updated_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-            ON CONFLICT(campaign_id, publish_link) DO UPDATE SET
-                platform = excluded.platform,
-                status = excluded.status,
-                raw_payload = excluded.raw_payload,
-                updated_at = excluded.updated_at
-            """,
-            (campaign_id, publish_link.strip(), platform, status, serialized_payload, now, now),
+        cur = conn.execute(
+            "SELECT * FROM campaigns WHERE owner_user_id = ? AND lower(name) = lower(?) LIMIT 1",
+            (owner_user_id, name),
         )
+        return _row_to_dict(cur.fetchone())
+
+
+_ADD_KOL_SOURCE_SQL = """
+INSERT INTO kol_sources (campaign_id, publish_link, platform, status, raw_payload, payload_hash, created_at, updated_at)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(campaign_id, publish_link) DO UPDATE SET
+    platform = excluded.platform,
+    status = excluded.status,
+    raw_payload = excluded.raw_payload,
+    payload_hash = excluded.payload_hash,
+    updated_at = excluded.updated_at
+WHERE excluded.payload_hash IS NOT kol_sources.payload_hash
+   OR excluded.status IS NOT kol_sources.status
+   OR excluded.platform IS NOT kol_sources.platform
+"""
+
+
+def _kol_source_params(
+    campaign_id: int,
+    publish_link: str,
+    platform: Optional[str],
+    status: str,
+    payload: Dict[str, Any],
+    now: str,
+) -> tuple:
+    serialized_payload = json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    payload_hash = hashlib.sha1(serialized_payload).hexdigest()
+    # Stored as a zlib-compressed BLOB; read it back with decode_kol_payload.
+    compressed = zlib.compress(serialized_payload)
+    return (campaign_id, publish_link.strip(), platform, status, compressed, payload_hash, now, now)
+
+
+def decode_kol_payload(raw_payload: Any) -> Dict[str, Any]:
+    """
+    Decode a kol_sources.raw_payload value (compressed BLOB, or plain JSON text from older rows).
+    """
+    if not raw_payload:
+        return {}
+    try:
+        if isinstance(raw_payload, (bytes, bytearray, memoryview)):
+            raw_payload = zlib.decompress(raw_payload)
+        payload = json.loads(raw_payload)
+    except (zlib.error, ValueError):
+        return {}
+    return payload if isinstance(payload, dict) else {}
+
+
+def add_kol_source(campaign_id: int, publish_link: str, platform: str, payload: Dict[str, Any], status: str = "ingested") -> None:
+    """
+    Upsert a source row; re-importing an unchanged payload leaves the stored row untouched.
+    """
+    params = _kol_source_params(campaign_id, publish_link, platform, status, payload, _now())
+    with session() as conn:
+        conn.execute(_ADD_KOL_SOURCE_SQL, params)
         conn.commit()
 
 
@@ -212,27 +370,40 @@ def list_kol_sources(campaign_id: int) -> List[Dict[str, Any]]:
             """,
             (campaign_id,),
         )
-        return [_row_to_dict(row) for row in cur.fetchall()]
+        return [dict(row) for row in cur]
+
+
+def count_kol_sources(campaign_id: int) -> int:
+    with session() as conn:
+        cur = conn.execute("SELECT COUNT(*) FROM kol_sources WHERE campaign_id = ?", (campaign_id,))
+        return cur.fetchone()[0]
+
+
+def _fts_prefix_query(search: str) -> str:
+    """
+    Turn free text into an FTS5 query matching every word as a prefix.
+    """
+    terms = search.replace('"', " ").split()
+    return " ".join(f'"{term}"*' for term in terms)
 
 
 def list_all_influencers(search: Optional[str] = None, limit: int = 500) -> List[Dict[str, Any]]:
     """
     List influencers across the entire workspace for reuse.
     """
-    search_term = f"%{search.strip().lower()}%" if search else None
+    match_query = _fts_prefix_query(search) if search else ""
     with session() as conn:
-        if search_term:
+        if match_query:
             cur = conn.execute(
                 """
-                SELECT id, name, handle, platform, follower_count, last_seen_at
-                FROM influencers
-                WHERE lower(name) LIKE ?
-                   OR lower(handle) LIKE ?
-                   OR lower(platform) LIKE ?
-                ORDER BY last_seen_at DESC
+                SELECT i.id, i.name, i.handle, i.platform, i.follower_count, i.last_seen_at
+                FROM influencers_fts f
+                JOIN influencers i ON i.id = f.rowid
+                WHERE influencers_fts MATCH ?
+                ORDER BY i.last_seen_at DESC
                 LIMIT ?
                 """,
-                (search_term, search_term, search_term, limit),
+                (match_query, limit),
             )
         else:
             cur = conn.execute(
@@ -244,54 +415,143 @@ def list_all_influencers(search: Optional[str] = None, limit: int = 500) -> List
                 """,
                 (limit,),
             )
-        return [_row_to_dict(row) for row in cur.fetchall()]
+        return [dict(row) for row in cur]
 
 
-def upsert_influencer(profile: Dict[str, Any]) -> Dict[str, Any]:
-    now = _now()
-    handle = profile["handle"].strip().lower()
-    platform = profile.get("platform", "Unknown").strip()
+_UPSERT_INFLUENCER_SQL = """
+INSERT INTO influencers (name, handle, platform, follower_count, demographics_json, last_seen_at)
+VALUES (?, ?, ?, ?, ?, ?)
+ON CONFLICT(handle_norm, platform) DO UPDATE SET
+    name = excluded.name,
+    follower_count = excluded.follower_count,
+    demographics_json = excluded.demographics_json,
+    last_seen_at = excluded.last_seen_at
+"""
+
+
+def _influencer_params(profile: Dict[str, Any], now: str) -> tuple:
     demographics = profile.get("demographics") or {}
+    return (
+        profile.get("name", profile["handle"]).strip(),
+        profile["handle"].strip(),
+        profile.get("platform", "Unknown").strip(),
+        profile.get("follower_count"),
+        json.dumps(demographics, separators=(",", ":"), ensure_ascii=False),
+        now,
+    )
+
+
+def upsert_influencer(profile: Dict[str, Any]) -> Dict[str, Any]:
+    params = _influencer_params(profile, _now())
     with session() as conn:
-        conn.execute(
-            """
-            INSERT INTO influencers (name, handle, platform, follower_count, demographics_json, last_seen_at)
-            VALUES (?, ?, ?, ?, ?, ?)
-            ON CONFLICT(handle, platform) DO UPDATE SET
-                name = excluded.name,
-                follower_count = excluded.follower_count,
-                demographics_json = excluded.demographics_json,
-                last_seen_at = excluded.last_seen_at
-            """,
-            (
-                profile.get("name", profile["handle"]).strip(),
-                handle,
-                platform,
-                profile.get("follower_count"),
-                json.dumps(demographics),
-                now,
-            ),
-        )
+        row = conn.execute(_UPSERT_INFLUENCER_SQL + "RETURNING *", params).fetchone()
         conn.commit()
+        return _row_to_dict(row)
+
+
+_KEY_LOOKUP_BATCH = 300
+_WRITE_BATCH = 500
+# SQLite builds before 3.32 allow 999 bound variables per statement; each link row binds 4.
+_LINK_BATCH = 999 // 4
+
+
+def _lookup_influencers(conn: sqlite3.Connection, params: Sequence[tuple]) -> List[Dict[str, Any]]:
+    """
+    Fetch the stored influencer row for each upsert parameter tuple, in input order.
+
+    Matching goes through handle_norm so SQLite applies the same normalization it enforced on insert.
+    """
+    rows: List[Optional[Dict[str, Any]]] = [None] * len(params)
+    for start in range(0, len(params), _KEY_LOOKUP_BATCH):
+        chunk = params[start : start + _KEY_LOOKUP_BATCH]
+        placeholders = ", ".join("(?, ?, ?)" for _ in chunk)
+        values = [value for offset, row in enumerate(chunk) for value in (start + offset, row[1], row[2])]
         cur = conn.execute(
-            "SELECT * FROM influencers WHERE handle = ? AND platform = ?",
-            (handle, platform),
+            f"""
+            WITH keys(idx, handle, platform) AS (VALUES {placeholders})
+            SELECT keys.idx AS lookup_idx, i.*
+            FROM keys
+            JOIN influencers i ON i.handle_norm = lower(trim(keys.handle)) AND i.platform = keys.platform
+            """,
+            values,
         )
-        return _row_to_dict(cur.fetchone())
+        for row in cur:
+            found = dict(row)
+            rows[found.pop("lookup_idx")] = found
+    return rows
 
 
-def ensure_campaign_influencer(campaign_id: int, influencer_id: int) -> Dict[str, Any]:
+def upsert_influencers(profiles: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Upsert many influencer profiles in one transaction. Returns the stored rows in input order.
+    """
     now = _now()
+    params = [_influencer_params(profile, now) for profile in profiles]
+    if not params:
+        return []
+    influencers: List[Dict[str, Any]] = []
     with session() as conn:
-        conn.execute(
-            """
+        for start in range(0, len(params), _WRITE_BATCH):
+            chunk = params[start : start + _WRITE_BATCH]
+            conn.executemany(_UPSERT_INFLUENCER_SQL, chunk)
+            influencers.extend(_lookup_influencers(conn, chunk))
+        conn.commit()
+    return influencers
+
+
+_ENSURE_CAMPAIGN_INFLUENCER_SQL = """
+INSERT INTO campaign_influencers (campaign_id, influencer_id, created_at, updated_at)
+VALUES (?, ?, ?, ?)
+ON CONFLICT(campaign_id, influencer_id) DO UPDATE SET
+    updated_at = excluded.updated_at
+"""
+
+
+def _link_campaign_influencers(
+    conn: sqlite3.Connection,
+    campaign_id: int,
+    influencer_ids: Sequence[int],
+    now: str,
+) -> Dict[int, int]:
+    """
+    Insert or touch campaign links for distinct influencer ids; returns influencer_id -> campaign_influencer id.
+    """
+    link_ids: Dict[int, int] = {}
+    for start in range(0, len(influencer_ids), _LINK_BATCH):
+        chunk = influencer_ids[start : start + _LINK_BATCH]
+        placeholders = ", ".join("(?, ?, ?, ?)" for _ in chunk)
+        cur = conn.execute(
+            f"""
             INSERT INTO campaign_influencers (campaign_id, influencer_id, created_at, updated_at)
-            VALUES (?, ?, ?, ?)
+            VALUES {placeholders}
             ON CONFLICT(campaign_id, influencer_id) DO UPDATE SET
                 updated_at = excluded.updated_at
+            RETURNING id, influencer_id
             """,
-            (campaign_id, influencer_id, now, now),
+            [value for influencer_id in chunk for value in (campaign_id, influencer_id, now, now)],
         )
+        link_ids.update((row["influencer_id"], row["id"]) for row in cur.fetchall())
+    return link_ids
+
+
+def bulk_ensure_campaign_influencers(campaign_id: int, influencer_ids: Iterable[int]) -> List[int]:
+    """
+    Link many influencers to a campaign. Returns the campaign_influencer ids in input order.
+    """
+    influencer_ids = list(influencer_ids)
+    unique_ids = list(dict.fromkeys(influencer_ids))
+    if not unique_ids:
+        return []
+    with session() as conn:
+        link_ids = _link_campaign_influencers(conn, campaign_id, unique_ids, _now())
+        conn.commit()
+    return [link_ids[influencer_id] for influencer_id in influencer_ids]
+
+
+def ensure_campaign_influencer(campaign_id: int, influencer_id: int) -> Dict[str, Any]:
+    now = _now()
+    with session() as conn:
+        conn.execute(_ENSURE_CAMPAIGN_INFLUENCER_SQL, (campaign_id, influencer_id, now, now))
         conn.commit()
         cur = conn.execute(
             """
@@ -355,35 +615,100 @@ SCORE_COLUMNS = [
 ]
 
 
-def save_campaign_influencer_scores(campaign_influencer_id: int, payload: Dict[str, Any]) -> None:
-    now = _now()
-    assignments = ", ".join(f"{column} = ?" for column in SCORE_COLUMNS)
-    values = [payload.get(column) for column in SCORE_COLUMNS]
+_SAVE_SCORES_SQL = f"""
+UPDATE campaign_influencers
+SET {", ".join(f"{column} = ?" for column in SCORE_COLUMNS)}, updated_at = ?
+WHERE id = ?
+"""
+
+
+def _score_values(campaign_influencer_id: int, payload: Dict[str, Any], now: str) -> List[Any]:
+    get = payload.get
+    values = [get(column) for column in SCORE_COLUMNS]
     values.append(now)
     values.append(campaign_influencer_id)
+    return values
+
+
+def save_campaign_influencer_scores(campaign_influencer_id: int, payload: Dict[str, Any]) -> None:
+    now = _now()
     with session() as conn:
-        conn.execute(
-            f"""
-            UPDATE campaign_influencers
-            SET {assignments}, updated_at = ?
-            WHERE id = ?
-            """,
-            values,
+        conn.execute(_SAVE_SCORES_SQL, _score_values(campaign_influencer_id, payload, now))
+        conn.commit()
+
+
+def bulk_seed_influencers(campaign_id: int, records: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Persist seeded influencers plus their campaign link, source row, and scores in one transaction.
+
+    Each record carries `profile`, `publish_link`, `source_payload`, and `scores` keys.
+    Returns the influencer rows (with `campaign_influencer_id`) in input order.
+    """
+    records = list(records)
+    if not records:
+        return []
+    now = _now()
+    influencer_params = [_influencer_params(record["profile"], now) for record in records]
+    with session() as conn:
+        conn.executemany(_UPSERT_INFLUENCER_SQL, influencer_params)
+        influencers = _lookup_influencers(conn, influencer_params)
+        link_ids = _link_campaign_influencers(
+            conn,
+            campaign_id,
+            list(dict.fromkeys(influencer["id"] for influencer in influencers)),
+            now,
+        )
+        for influencer in influencers:
+            influencer["campaign_influencer_id"] = link_ids[influencer["id"]]
+        conn.executemany(
+            _ADD_KOL_SOURCE_SQL,
+            [
+                _kol_source_params(
+                    campaign_id,
+                    record["publish_link"],
+                    record["profile"].get("platform"),
+                    record.get("status", "seeded"),
+                    record["source_payload"],
+                    now,
+                )
+                for record in records
+            ],
+        )
+        conn.executemany(
+            _SAVE_SCORES_SQL,
+            [
+                _score_values(influencer["campaign_influencer_id"], record["scores"], now)
+                for influencer, record in zip(influencers, records)
+            ],
         )
         conn.commit()
+    return influencers
+
+
+_DEMOGRAPHICS_BLOB_COLUMN = "i.demographics_json"
+_DEMOGRAPHICS_SUMMARY_COLUMNS = (
+    "json_extract(i.demographics_json, '$.image_url') AS image_url, "
+    "json_extract(i.demographics_json, '$.bio') AS bio"
+)
+
 
+def list_campaign_influencers(campaign_id: int, include_demographics: bool = True) -> List[Dict[str, Any]]:
+    """
+    List a campaign's influencers with their scores.
 
-def list_campaign_influencers(campaign_id: int) -> List[Dict[str, Any]]:
+    Pass include_demographics=False to swap the raw demographics blob for its image_url and bio fields.
+    """
+    demographics_columns = _DEMOGRAPHICS_BLOB_COLUMN if include_demographics else _DEMOGRAPHICS_SUMMARY_COLUMNS
     with session() as conn:
         cur = conn.execute(
-            """
+            f"""
             SELECT
                 ci.id AS campaign_influencer_id,
                 i.name,
                 i.handle,
                 i.platform,
                 i.follower_count,
-                i.demographics_json,
+                {demographics_columns},
                 ci.reach_score,
                 ci.interest_score,
                 ci.engagement_rate,
@@ -407,11 +732,52 @@ def list_campaign_influencers(campaign_id: int) -> List[Dict[str, Any]]:
             """,
             (campaign_id,),
         )
-        return [_row_to_dict(row) for row in cur.fetchall()]
+        return [dict(row) for row in cur]
+
 
+def count_campaign_influencers(campaign_id: int) -> int:
+    with session() as conn:
+        cur = conn.execute("SELECT COUNT(*) FROM campaign_influencers WHERE campaign_id = ?", (campaign_id,))
+        return cur.fetchone()[0]
 
-def list_dashboard_rows(campaign_id: int) -> List[Dict[str, Any]]:
+
+DASHBOARD_ORDERINGS = {
+    "total_score": "ci.total_score DESC NULLS LAST, i.name ASC",
+    "name": "i.name ASC",
+    "updated_at": "ci.updated_at DESC",
+}
+
+
+def list_dashboard_rows(campaign_id: int, order_by: str = "total_score") -> List[Dict[str, Any]]:
     """
-    Convenience wrapper for dashboard consumption.
+    Dashboard projection of a campaign's influencers, sorted in SQL by one of DASHBOARD_ORDERINGS.
     """
-    return list_campaign_influencers(campaign_id)
+    ordering = DASHBOARD_ORDERINGS.get(order_by)
+    if ordering is None:
+        raise ValueError(f"Unsupported dashboard ordering: {order_by}")
+    with session() as conn:
+        cur = conn.execute(
+            f"""
+            SELECT
+                ci.id AS campaign_influencer_id,
+                i.name,
+                i.handle,
+                i.platform,
+                i.follower_count,
+                ci.reach_score,
+                ci.interest_score,
+                ci.engagement_rate,
+                ci.engagement_score,
+                ci.content_score,
+                ci.authority_score,
+                ci.values_score,
+                ci.total_score,
+                ci.updated_at
+            FROM campaign_influencers ci
+            JOIN influencers i ON i.id = ci.influencer_id
+            WHERE ci.campaign_id = ?
+            ORDER BY {ordering}
+            """,
+            (campaign_id,),
+        )
+        return [dict(row) for row in cur]
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import atexit
+import os
+import queue
 from typing import Dict, List, Optional
 
 from . import database
@@ -7,19 +10,56 @@ from .creatoriq import CreatorIQClient, CreatorIQError, CreatorRecord, extract_s
 from .creatoriq_dom import CreatorIQDomScraper, normalize_dom_profile
 
 
+_MISSING_HANDLE_WARNING = "Skipped a creator because handle/username was missing."
+
+# Warm scrapers (each holding a live Chrome session) shared across DOM ingests.
+# maxsize <= 0 would make the queue unbounded, so always keep at least one slot.
+_SCRAPER_POOL_SIZE = max(1, int(os.getenv("TRUEVIBE_DRIVER_POOL", "2")))
+_SCRAPER_POOL: "queue.Queue[CreatorIQDomScraper]" = queue.Queue(maxsize=_SCRAPER_POOL_SIZE)
+# Browsers per pooled scraper for detail pages (its listing browser plus warm extras).
+_DETAIL_WORKERS = max(1, int(os.getenv("TRUEVIBE_DETAIL_WORKERS", "4")))
+# Recycle browsers after this many reports to cap Chrome's memory growth.
+_SCRAPER_MAX_RUNS = 20
+
+
+def _checkout_scraper(headless: bool) -> CreatorIQDomScraper:
+    while True:
+        try:
+            scraper = _SCRAPER_POOL.get_nowait()
+        except queue.Empty:
+            return CreatorIQDomScraper(headless=headless, detail_workers=_DETAIL_WORKERS, reuse_driver=True)
+        if scraper.headless == headless:
+            return scraper
+        scraper.close()
+
+
+def _return_scraper(scraper: CreatorIQDomScraper) -> None:
+    if scraper.runs >= _SCRAPER_MAX_RUNS:
+        scraper.close()
+        return
+    try:
+        _SCRAPER_POOL.put_nowait(scraper)
+    except queue.Full:
+        scraper.close()
+
+
+@atexit.register
+def _close_pooled_scrapers() -> None:
+    while True:
+        try:
+            _SCRAPER_POOL.get_nowait().close()
+        except queue.Empty:
+            return
+
+
+_DEMO_KEYS = ("country", "city", "gender", "language", "tags", "categories", "subCategories")
+
+
 def _normalize_creator_payload(creator: Dict[str, object]) -> Dict[str, object]:
     accounts = creator.get("accounts") or []
     account = accounts[0] if accounts else {}
     follower_count = creator.get("totalSocialConnections") or account.get("followers")
-    demographics = {
-        "country": creator.get("country"),
-        "city": creator.get("city"),
-        "gender": creator.get("gender"),
-        "language": creator.get("language"),
-        "tags": creator.get("tags"),
-        "categories": creator.get("categories"),
-        "subCategories": creator.get("subCategories"),
-    }
+    demographics = dict(zip(_DEMO_KEYS, map(creator.get, _DEMO_KEYS)))
     profile = {
         "name": creator.get("fullName") or creator.get("primarySocialUsername"),
         "handle": creator.get("primarySocialUsername") or creator.get("listCreatorsId"),
@@ -32,32 +72,41 @@ def _normalize_creator_payload(creator: Dict[str, object]) -> Dict[str, object]:
     return profile
 
 
+INGEST_BATCH_SIZE = 500
+
+
+def _persist_batch(campaign_id: int, profiles: List[Dict[str, object]]) -> List[int]:
+    influencers = database.upsert_influencers(profiles)
+    return database.bulk_ensure_campaign_influencers(campaign_id, [influencer["id"] for influencer in influencers])
+
+
 def ingest_creatoriq_report(campaign_id: int, publish_link: str) -> Dict[str, object]:
     """
     Pull all creators from a CreatorIQ share link and persist them to the database.
 
-    Returns a summary dictionary with the amount of imported creators and potential warnings.
+    Returns a summary dictionary with the amount of imported and skipped creators and a sample warning.
     """
     if not is_creatoriq_link(publish_link):
         raise ValueError("Link does not belong to CreatorIQ.")
 
     slug = extract_slug(publish_link)
     client = CreatorIQClient(slug=slug)
-    creators_data = client.fetch_creators()
     imported_ids: List[int] = []
-    warnings: List[str] = []
+    skipped = 0
+    skip_reason: Optional[str] = None
+    batch: List[Dict[str, object]] = []
 
-    for creator in creators_data:
-        creator_id = creator.get("id") or creator.get("listCreatorsId")
+    for creator in client.fetch_creators():
         record = CreatorRecord(data=creator, detail=None)
         payload = record.merged()
         profile = _normalize_creator_payload(payload)
 
         if not profile.get("handle"):
-            warnings.append("Skipped a creator because handle/username was missing.")
+            skipped += 1
+            skip_reason = skip_reason or _MISSING_HANDLE_WARNING
             continue
 
-        influencer = database.upsert_influencer(
+        batch.append(
             {
                 "name": profile.get("name") or profile["handle"],
                 "handle": profile["handle"],
@@ -66,8 +115,11 @@ def ingest_creatoriq_report(campaign_id: int, publish_link: str) -> Dict[str, ob
                 "demographics": profile.get("demographics"),
             }
         )
-        campaign_influencer = database.ensure_campaign_influencer(campaign_id, influencer["id"])
-        imported_ids.append(campaign_influencer["campaign_influencer_id"])
+        if len(batch) >= INGEST_BATCH_SIZE:
+            imported_ids.extend(_persist_batch(campaign_id, batch))
+            batch = []
+    if batch:
+        imported_ids.extend(_persist_batch(campaign_id, batch))
 
     database.add_kol_source(
         campaign_id=campaign_id,
@@ -76,7 +128,7 @@ def ingest_creatoriq_report(campaign_id: int, publish_link: str) -> Dict[str, ob
         payload={"imported_ids": imported_ids},
         status="imported",
     )
-    return {"count": len(imported_ids), "warnings": warnings}
+    return {"count": len(imported_ids), "skipped": skipped, "warning": skip_reason}
 
 
 def ingest_creatoriq_report_dom(
@@ -92,23 +144,27 @@ def ingest_creatoriq_report_dom(
     """
     if not is_creatoriq_link(publish_link):
         raise ValueError("Link does not belong to CreatorIQ.")
-    scraper = CreatorIQDomScraper(headless=headless)
-    profiles = scraper.scrape_report(
-        publish_link,
-        max_profiles=max_profiles,
-        detail_limit=detail_limit,
-    )
-    imported_ids: List[int] = []
-    warnings: List[str] = []
+    scraper = _checkout_scraper(headless)
+    try:
+        profiles = scraper.scrape_report(
+            publish_link,
+            max_profiles=max_profiles,
+            detail_limit=detail_limit,
+        )
+    finally:
+        _return_scraper(scraper)
+    skipped = 0
+    skip_reason: Optional[str] = None
+    normalized_profiles: List[Dict[str, object]] = []
     for profile in profiles:
         normalized = normalize_dom_profile(profile)
         handle = normalized.get("handle")
         if not handle or handle == "unknown":
-            warnings.append("Skipped a creator because handle/username was missing.")
+            skipped += 1
+            skip_reason = skip_reason or _MISSING_HANDLE_WARNING
             continue
-        influencer = database.upsert_influencer(normalized)
-        campaign_influencer = database.ensure_campaign_influencer(campaign_id, influencer["id"])
-        imported_ids.append(campaign_influencer["campaign_influencer_id"])
+        normalized_profiles.append(normalized)
+    imported_ids = _persist_batch(campaign_id, normalized_profiles)
     database.add_kol_source(
         campaign_id=campaign_id,
         publish_link=publish_link,
@@ -116,4 +172,4 @@ def ingest_creatoriq_report_dom(
         payload={"profiles": profiles, "max_profiles": max_profiles},
         status="imported",
     )
-    return {"count": len(imported_ids), "warnings": warnings}
+    return {"count": len(imported_ids), "skipped": skipped, "warning": skip_reason}
@@ -1,25 +1,45 @@
 from __future__ import annotations
 
 import re
-from typing import Any, Dict, Optional, Set
+import unicodedata
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, Optional, Set
+
+# Letters and digits in any script, so non-English objectives still produce keywords.
+_TOKEN_RE = re.compile(r"[^\W_]+")
+_STOPWORDS = frozenset(
+    {
+        # English
+        "the", "and", "for", "with", "from", "that", "this", "are", "was", "our", "your",
+        "their", "into", "about", "over", "via", "all", "any", "more", "has", "have", "will",
+        # Vietnamese
+        "của", "với", "cho", "các", "những", "này", "được", "trong", "một", "không", "theo",
+        "từ", "như", "khi", "hơn", "nhiều", "cũng", "đến", "vào",
+    }
+)
+_PCT_RE = re.compile(r"([0-9]+(?:\.[0-9]+)?)\s*%")
 
 
 def _clamp(score: float) -> float:
     return max(1.0, min(5.0, float(score)))
 
 
-def _average(*values: Optional[float]) -> float:
-    cleaned = [float(value) for value in values if value is not None]
-    if not cleaned:
-        return 0.0
-    return sum(cleaned) / len(cleaned)
+def _clamp_round(score: float) -> float:
+    value = float(score)
+    if not 1.0 <= value <= 5.0:
+        value = 1.0 if value < 1.0 else 5.0
+    return round(value, 2)
 
 
 def compute_content_score(originality: float, creativity: float, balance: Optional[float] = None) -> float:
     """
     Content now uses two required prompts (Originality, Creative) and an optional Balance legacy field.
     """
-    return round(_average(_clamp(originality), _clamp(creativity), _clamp(balance) if balance is not None else None), 2)
+    total = _clamp(originality) + _clamp(creativity)
+    if balance is None:
+        return round(total * 0.5, 2)
+    return round((total + _clamp(balance)) / 3.0, 2)
 
 
 def compute_authority_score(*components: Optional[float]) -> float:
@@ -39,15 +59,20 @@ def compute_values_score(*components: Optional[float]) -> float:
     return round(sum(cleaned) / len(cleaned), 2)
 
 
-def _keyword_set(*parts: Optional[str]) -> Set[str]:
-    tokens: Set[str] = set()
+def _iter_tokens(*parts: Optional[str]) -> Iterator[str]:
     for part in parts:
         if not part:
             continue
-        for token in re.findall(r"[A-Za-z0-9]+", str(part).lower()):
-            if len(token) >= 3:
-                tokens.add(token)
-    return tokens
+        text = part if isinstance(part, str) else str(part)
+        # NFC keeps precomposed accents (e.g. Vietnamese) attached to their letters.
+        for match in _TOKEN_RE.finditer(unicodedata.normalize("NFC", text).lower()):
+            token = match.group()
+            if len(token) >= 3 and token not in _STOPWORDS:
+                yield token
+
+
+def _keyword_set(*parts: Optional[str]) -> Set[str]:
+    return set(_iter_tokens(*parts))
 
 
 def _collect_text(value: Any) -> str:
@@ -58,42 +83,63 @@ def _collect_text(value: Any) -> str:
     return str(value)
 
 
+_REACH_BOUNDARIES = (10_000, 50_000, 200_000, 500_000, 1_000_000)
+_REACH_SCORES = (1.5, 2.0, 3.0, 4.0, 4.5, 5.0)
+
+
+def _reach_tier(follower_count: int) -> float:
+    return _REACH_SCORES[bisect_right(_REACH_BOUNDARIES, follower_count)]
+
+
 def estimate_reach_score(follower_count: Optional[int]) -> float:
     if not follower_count or follower_count <= 0:
         return 1.0
-    thresholds = [
-        (10_000, 2.0),
-        (50_000, 3.0),
-        (200_000, 4.0),
-        (500_000, 4.5),
-        (1_000_000, 5.0),
-    ]
-    score = 1.5
-    for boundary, boundary_score in thresholds:
-        if follower_count >= boundary:
-            score = boundary_score
-    return round(min(score, 5.0), 2)
+    return _reach_tier(int(follower_count))
 
 
-def estimate_interest_score(topic_text: Optional[str], objective_text: Optional[str]) -> float:
+_INTEREST_BY_OVERLAP = (2.5, 3.5, 4.0, 5.0)
+_NO_KEYWORDS_INTEREST = 3.0
+_OVERLAP_CAP = len(_INTEREST_BY_OVERLAP) - 1
+
+
+def keyword_overlap(topic_text: Optional[str], objective_text: Optional[str]) -> int:
+    """
+    Count shared keywords (capped at _OVERLAP_CAP) between creator topics and the campaign objective, or -1 when either side has none.
+    """
     topic_tokens = _keyword_set(topic_text)
-    objective_tokens = _keyword_set(objective_text)
-    if not topic_tokens or not objective_tokens:
-        return 3.0
-    overlap = len(topic_tokens & objective_tokens)
-    if overlap >= 3:
-        return 5.0
-    if overlap == 2:
-        return 4.0
-    if overlap == 1:
-        return 3.5
-    return 2.5
+    if not topic_tokens:
+        return -1
+    matched: Set[str] = set()
+    saw_objective_token = False
+    for token in _iter_tokens(objective_text):
+        saw_objective_token = True
+        if token in topic_tokens:
+            matched.add(token)
+            if len(matched) >= _OVERLAP_CAP:
+                break
+    return len(matched) if saw_objective_token else -1
+
+
+def estimate_interest_score(topic_text: Optional[str], objective_text: Optional[str]) -> float:
+    overlap = keyword_overlap(topic_text, objective_text)
+    if overlap < 0:
+        return _NO_KEYWORDS_INTEREST
+    return _INTEREST_BY_OVERLAP[min(overlap, _OVERLAP_CAP)]
 
 
 def _parse_percentage(value: Any) -> Optional[float]:
     if not value:
         return None
-    match = re.search(r"([0-9]+(?:\.[0-9]+)?)\s*%", str(value))
+    text = (value if isinstance(value, str) else str(value)).strip()
+    # Fast path for the usual well-formed "3.42%"; anything else goes through the regex.
+    if text.endswith("%") and text.isascii():
+        whole, dot, fraction = text[:-1].rstrip().partition(".")
+        if whole.isdigit() and (not dot or fraction.isdigit()):
+            try:
+                return float(text[:-1])
+            except ValueError:
+                pass
+    match = _PCT_RE.search(text)
     if not match:
         return None
     return float(match.group(1))
@@ -113,18 +159,18 @@ def extract_engagement_rate(details: Optional[Dict[str, Any]]) -> float:
     return 0.0
 
 
+_ENGAGEMENT_BOUNDARIES = (1.0, 2.0, 4.0, 6.0)
+_ENGAGEMENT_SCORES = (1.5, 2.0, 3.0, 4.0, 5.0)
+
+
+def _engagement_tier(rate_percent: float) -> float:
+    return _ENGAGEMENT_SCORES[bisect_right(_ENGAGEMENT_BOUNDARIES, rate_percent)]
+
+
 def engagement_score_from_rate(rate_percent: float) -> float:
-    if rate_percent >= 6.0:
-        return 5.0
-    if rate_percent >= 4.0:
-        return 4.0
-    if rate_percent >= 2.0:
-        return 3.0
-    if rate_percent >= 1.0:
-        return 2.0
-    if rate_percent > 0:
-        return 1.5
-    return 1.0
+    if not rate_percent > 0:
+        return 1.0
+    return _engagement_tier(float(rate_percent))
 
 
 def derive_quantitative_scores(
@@ -165,16 +211,40 @@ def compute_total_score(
     content_score: float,
     authority_score: float,
     values_score: float,
+    *,
+    clamped: bool = False,
 ) -> float:
-    total = (
-        _clamp(reach_score)
-        + _clamp(interest_score)
-        + _clamp(engagement_score)
-        + content_score
-        + authority_score
-        + values_score
-    )
-    return round(total, 2)
+    """
+    Sum the six dimensions. Pass clamped=True when reach/interest/engagement are already within 1-5.
+    """
+    if not clamped:
+        reach_score, interest_score, engagement_score = _clamp(reach_score), _clamp(interest_score), _clamp(engagement_score)
+    return round(reach_score + interest_score + engagement_score + content_score + authority_score + values_score, 2)
+
+
+@dataclass(slots=True, frozen=True)
+class ScorePayload:
+    reach_score: float
+    interest_score: float
+    engagement_rate: float
+    engagement_score: float
+    content_originality: float
+    content_creativity: float
+    content_score: float
+    authority_score: float
+    values_score: float
+    total_score: float
+    qualitative_notes: str
+    content_balance: Optional[float] = None
+    organic_posts_l2m: Optional[float] = None
+    sponsored_posts_l2m: Optional[float] = None
+    saturation_rate: Optional[float] = None
+
+    def as_dict(self) -> Dict[str, float | str | None]:
+        """
+        Plain-dict view for persistence and serialization boundaries.
+        """
+        return {name: getattr(self, name) for name in self.__slots__}
 
 
 def build_score_payload(
@@ -192,32 +262,34 @@ def build_score_payload(
     authority_overall: float,
     values_overall: float,
     qualitative_notes: str,
-) -> Dict[str, float | str]:
+) -> ScorePayload:
+    reach, interest, engagement = _clamp_round(reach_score), _clamp_round(interest_score), _clamp_round(engagement_score)
     content_score = compute_content_score(content_originality, content_creativity, content_balance_score)
     authority_score = compute_authority_score(authority_overall)
     values_score = compute_values_score(values_overall)
     total_score = compute_total_score(
-        reach_score,
-        interest_score,
-        engagement_score,
+        reach,
+        interest,
+        engagement,
         content_score,
         authority_score,
         values_score,
+        clamped=True,
+    )
+    return ScorePayload(
+        reach_score=reach,
+        interest_score=interest,
+        engagement_rate=round(float(engagement_rate or 0.0), 4),
+        engagement_score=engagement,
+        content_balance=_clamp_round(content_balance_score) if content_balance_score is not None else None,
+        content_originality=_clamp_round(content_originality),
+        content_creativity=_clamp_round(content_creativity),
+        content_score=content_score,
+        authority_score=authority_score,
+        values_score=values_score,
+        total_score=total_score,
+        qualitative_notes=qualitative_notes.strip(),
+        organic_posts_l2m=float(organic_posts_l2m) if organic_posts_l2m is not None else None,
+        sponsored_posts_l2m=float(sponsored_posts_l2m) if sponsored_posts_l2m is not None else None,
+        saturation_rate=round(float(saturation_rate), 4) if saturation_rate is not None else None,
     )
-    return {
-        "reach_score": round(_clamp(reach_score), 2),
-        "interest_score": round(_clamp(interest_score), 2),
-        "engagement_rate": round(float(engagement_rate or 0.0), 4),
-        "engagement_score": round(_clamp(engagement_score), 2),
-        "content_balance": round(_clamp(content_balance_score), 2) if content_balance_score is not None else None,
-        "content_originality": round(_clamp(content_originality), 2),
-        "content_creativity": round(_clamp(content_creativity), 2),
-        "content_score": content_score,
-        "authority_score": authority_score,
-        "values_score": values_score,
-        "total_score": total_score,
-        "qualitative_notes": qualitative_notes.strip(),
-        "organic_posts_l2m": float(organic_posts_l2m) if organic_posts_l2m is not None else None,
-        "sponsored_posts_l2m": float(sponsored_posts_l2m) if sponsored_posts_l2m is not None else None,
-        "saturation_rate": round(float(saturation_rate), 4) if saturation_rate is not None else None,
-    }
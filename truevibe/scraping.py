@@ -1,26 +1,33 @@
 from __future__ import annotations
 
-from hashlib import md5
-from typing import Dict
-from urllib.parse import urlparse
+from copy import deepcopy
+from functools import lru_cache
+from hashlib import blake2b
+from typing import Dict, Optional
+from urllib.parse import ParseResult, urlparse
 
 
-PLATFORM_HINTS = {
-    "tiktok": "TikTok",
-    "instagram": "Instagram",
-    "facebook": "Facebook",
-    "youtube": "YouTube",
+PLATFORM_BY_DOMAIN = {
+    "tiktok.com": "TikTok",
+    "instagram.com": "Instagram",
+    "facebook.com": "Facebook",
+    "youtube.com": "YouTube",
+    "youtu.be": "YouTube",
     "x.com": "X",
-    "twitter": "X",
+    "twitter.com": "X",
 }
 
 
-def infer_platform(publish_link: str) -> str:
-    parsed = urlparse(publish_link)
-    netloc = parsed.netloc.lower()
-    for hint, platform in PLATFORM_HINTS.items():
-        if hint in netloc:
+@lru_cache(maxsize=1024)
+def infer_platform(publish_link: str, *, parsed: Optional[ParseResult] = None) -> str:
+    """Map a link to its platform; pass ``parsed`` to reuse an existing urlparse result."""
+    host = (parsed or urlparse(publish_link)).hostname or ""
+    # Probe the host and each parent domain, e.g. vt.tiktok.com -> tiktok.com.
+    while host:
+        platform = PLATFORM_BY_DOMAIN.get(host)
+        if platform:
             return platform
+        _, _, host = host.partition(".")
     return "Unknown"
 
 
@@ -30,12 +37,18 @@ def fetch_kol_profile(publish_link: str) -> Dict[str, object]:
 
     The current implementation generates deterministic placeholder values so the
     rest of the system can be wired up before integrating a real scraper.
+    Results are memoized per link; each caller gets its own copy to mutate freely.
     """
+    return deepcopy(_build_kol_profile(publish_link))
+
+
+@lru_cache(maxsize=4096)
+def _build_kol_profile(publish_link: str) -> Dict[str, object]:
     parsed = urlparse(publish_link)
-    platform = infer_platform(publish_link)
+    platform = infer_platform(publish_link, parsed=parsed)
     slug = parsed.path.strip("/").split("/")[-1] if parsed.path else ""
     handle = slug or parsed.netloc.split(".")[0]
-    fingerprint = int(md5(publish_link.encode("utf-8")).hexdigest(), 16)
+    fingerprint = int.from_bytes(blake2b(publish_link.encode("utf-8"), digest_size=8).digest(), "big")
     follower_count = 5_000 + (fingerprint % 500_000)
     engagement_rate = round((fingerprint % 450) / 100 + 1.2, 2)  # roughly 1.2% - 5.7%
     primary_market = parsed.netloc.split(".")[-1]